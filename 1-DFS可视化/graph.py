@@ -1,8 +1,13 @@
 import pygame
 import networkx as nx
 import time
+import sys
+import os
 from collections import defaultdict
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_engine import SearchObserver, SearchTrace  # 事件轨迹的记录与回放
+
 # 初始化pygame
 pygame.init()
 WIDTH, HEIGHT = 1200, 800
@@ -56,29 +61,69 @@ for node, (x, y) in raw_pos.items():
     scaled_y = max(MARGIN + NODE_SIZE, min(HEIGHT - MARGIN - NODE_SIZE - LABEL_OFFSET, scaled_y))
     pos[node] = (scaled_x, scaled_y)
 
-# DFS算法
-def dfs_search_path(start, end, G, screen, pos):
-    stack = [(start, [start])]
-    all_paths = []
-    
+# DFS算法：枚举所有简单路径并返回最短的一条
+def dfs_search_path(start, end, G, trace=None):
+    # 所有分支共享同一条当前路径，栈中只存每层邻居的迭代器，
+    # 不再为每个入栈节点复制一份 path + [neighbor]
+    path = [start]
+    on_path = {start}  # O(1) 判断节点是否已在当前路径上
+    stack = [iter(reversed(list(G[start])))]
+    shortest_path = None
+
+    if start == end:
+        return path
+    # 搜索时不绘图，只把 进入(push)/回溯(backtrack) 事件按整数 id 记进紧凑轨迹，事后回放成动画
+    if trace is not None:
+        names = list(G.nodes())
+        index = {node: i for i, node in enumerate(names)}
+        trace.set_decoder(names=names)
+        trace.on_expand(index[start])
+
     while stack:
-        current, path = stack.pop()
-        if current == end:
-            all_paths.append(path)
+        neighbor = next(stack[-1], None)
+        if neighbor is None:
+            # 当前节点的邻居已全部尝试，回溯
+            stack.pop()
+            node = path.pop()
+            on_path.discard(node)
+            if trace is not None:
+                trace.on_backtrack(index[node])
             continue
-        
-        for neighbor in G[current]:
-            if neighbor not in path:
-                stack.append((neighbor, path + [neighbor]))
-        
-        # 动画绘制当前状态
-        animate_step(screen, G, pos, path, current)
-    
-    # 找到最短路径
-    if all_paths:
-        shortest_path = min(all_paths, key=len)
-        return shortest_path
-    return None
+        if neighbor in on_path:
+            continue
+
+        if neighbor == end:
+            # 只在找到更短路径时才复制一次路径
+            if shortest_path is None or len(path) + 1 < len(shortest_path):
+                shortest_path = path + [neighbor]
+            continue
+
+        if trace is not None:
+            trace.on_push(index[neighbor], index[path[-1]])
+        path.append(neighbor)
+        on_path.add(neighbor)
+        stack.append(iter(reversed(list(G[neighbor]))))
+
+    if trace is not None and shortest_path is not None:
+        trace.on_path([index[node] for node in shortest_path])
+    return shortest_path
+
+class PathAnimator(SearchObserver):
+    """回放 DFS 轨迹：根据进入/回溯事件重建当前路径，并逐步绘制"""
+    def __init__(self, screen, G, pos):
+        self.screen, self.G, self.pos = screen, G, pos
+        self.path = []
+
+    def on_expand(self, node):
+        self.path = [node]
+        animate_step(self.screen, self.G, self.pos, self.path, node)
+
+    def on_push(self, node, parent):
+        self.path.append(node)
+        animate_step(self.screen, self.G, self.pos, self.path, node)
+
+    def on_backtrack(self, node):
+        self.path.pop()
 
 # 动画绘制函数
 def animate_step(screen, G, pos, current_path, current_node):
@@ -144,7 +189,10 @@ def main():
                 running = False
         
         if not shortest_path:
-            shortest_path = dfs_search_path(start, end, G, screen, pos)
+            # 先全速搜索并记录轨迹，再把轨迹回放成动画
+            trace = SearchTrace()
+            shortest_path = dfs_search_path(start, end, G, trace)
+            trace.replay(PathAnimator(screen, G, pos))
         
         if shortest_path:
             screen.fill(BACKGROUND)
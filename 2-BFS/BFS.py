@@ -1,11 +1,36 @@
+import os
+import sys
 import networkx as nx
-from collections import deque
 
 import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_engine import SearchObserver, bfs
+
 # 设置字体为支持中文的字体
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
+class BFSDrawer(SearchObserver):
+    """把 BFS 的扩展过程画到 matplotlib 图上"""
+    def __init__(self, G, pos):
+        self.G = G
+        self.pos = pos
+
+    def on_expand(self, node):
+        # 高亮当前访问的节点
+        nx.draw_networkx_nodes(self.G, self.pos, nodelist=[node], node_color='#E6B8B7')
+        plt.pause(0.5)
+
+    def on_push(self, node, parent):
+        nx.draw_networkx_edges(self.G, self.pos, edgelist=[(parent, node)], edge_color='#8C8C8C')
+        plt.pause(0.05)
+
+    def on_path(self, path):
+        # 找到目标节点，绘制最终路径
+        nx.draw_networkx_edges(self.G, self.pos, edgelist=[(path[i], path[i+1]) for i in range(len(path)-1)], edge_color='red', width=2)
+        nx.draw_networkx_nodes(self.G, self.pos, nodelist=path, node_color='red')
+
 def bfs_visualization(graph, start_node, end_node):
     G = nx.Graph()
     # 将字典转换为边的列表
@@ -16,32 +41,10 @@ def bfs_visualization(graph, start_node, end_node):
     # 使用莫兰迪色系绘制初始图
     nx.draw(G, pos, with_labels=True, node_color='#B0A8B9', edge_color='#A3A3A3')
     
-    visited = set()  # 记录已访问节点
-    queue = deque([(start_node, [start_node])])  # 队列存储当前节点及路径
-    
-    while queue:
-        node, path = queue.popleft()
-        if node not in visited:
-            visited.add(node)
-            # 高亮当前访问的节点
-            nx.draw_networkx_nodes(G, pos, nodelist=[node], node_color='#E6B8B7')
-            plt.pause(0.5)
-            
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    if neighbor == end_node:
-                        # 找到目标节点，绘制最终路径
-                        final_path = path + [neighbor]
-                        nx.draw_networkx_edges(G, pos, edgelist=[(final_path[i], final_path[i+1]) for i in range(len(final_path)-1)], edge_color='red', width=2)
-                        nx.draw_networkx_nodes(G, pos, nodelist=final_path, node_color='red')
-                        plt.show()
-                        return
-                    # 将邻居节点加入队列
-                    queue.append((neighbor, path + [neighbor]))
-                    nx.draw_networkx_edges(G, pos, edgelist=[(node, neighbor)], edge_color='#8C8C8C')
-                    plt.pause(0.05)
-    
+    # 搜索本身不含绘图，绘图全部由观察者完成
+    result = bfs(graph, start_node, end_node, observer=BFSDrawer(G, pos))
     plt.show()
+    return result
 
 if __name__ == "__main__":
     # 定义城市图
@@ -1,67 +1,76 @@
+import os
+import sys
 import networkx as nx
-from queue import PriorityQueue
 
 import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_engine import SearchObserver, ucs
+
 # 设置字体为支持中文的字体
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
+class UCSDrawer(SearchObserver):
+    """把 UCS 的扩展过程画到 matplotlib 图上"""
+    def __init__(self, G, pos):
+        self.G = G
+        self.pos = pos
+
+    def on_expand(self, node):
+        nx.draw_networkx_nodes(self.G, self.pos, nodelist=[node], node_color='#E6B8B7')
+        plt.pause(0.5)
+
+    def on_push(self, node, parent):
+        nx.draw_networkx_edges(self.G, self.pos, edgelist=[(parent, node)], edge_color='#8C8C8C')
+        plt.pause(0.05)
+
+    def on_path(self, path):
+        nx.draw_networkx_edges(self.G, self.pos, edgelist=[(path[i], path[i+1]) for i in range(len(path)-1)], edge_color='red', width=2)
+        nx.draw_networkx_nodes(self.G, self.pos, nodelist=path, node_color='red')
+
 def usc_visualization(graph, start_node, end_node):
+    """graph 为带权邻接表 {节点: {邻居: 距离}}"""
     G = nx.Graph()
-    # 将字典转换为边的列表
-    edges = [(node, neighbor) for node in graph for neighbor in graph[node]]
-    G.add_edges_from(edges)
+    # 将字典转换为带权边的列表
+    edges = [(node, neighbor, graph[node][neighbor]) for node in graph for neighbor in graph[node]]
+    G.add_weighted_edges_from(edges)
     
     pos = nx.spring_layout(G)
     # 使用莫兰迪色系
     nx.draw(G, pos, with_labels=True, node_color='#B0A8B9', edge_color='#A3A3A3')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=nx.get_edge_attributes(G, 'weight'), font_size=7)
     
-    visited = set()
-    pq = PriorityQueue()
-    pq.put((0, start_node, [start_node]))
-    
-    while not pq.empty():
-        cost, node, path = pq.get()
-        if node not in visited:
-            visited.add(node)
-            nx.draw_networkx_nodes(G, pos, nodelist=[node], node_color='#E6B8B7')
-            plt.pause(0.5)
-            
-            if node == end_node:
-                nx.draw_networkx_edges(G, pos, edgelist=[(path[i], path[i+1]) for i in range(len(path)-1)], edge_color='red', width=2)
-                nx.draw_networkx_nodes(G, pos, nodelist=path, node_color='red')
-                plt.show()
-                return
-            
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    pq.put((cost + 1, neighbor, path + [neighbor]))
-                    nx.draw_networkx_edges(G, pos, edgelist=[(node, neighbor)], edge_color='#8C8C8C')
-                    plt.pause(0.05)
-    
+    result = ucs(graph, start_node, end_node, observer=UCSDrawer(G, pos))
+    if result.path is None:
+        print("无路径")
+    else:
+        print(f"最短路径: {' -> '.join(result.path)}，总距离 {result.cost:g}")
     plt.show()
+    return result
 
 if __name__ == "__main__":
+    # 罗马尼亚地图，边权为城市间的公路距离
     city_graph_example = {
-        'Arad': ['Zerind', 'Sibiu', 'Timisoara'],
-        'Zerind': ['Arad', 'Oradea'],
-        'Oradea': ['Zerind', 'Sibiu'],
-        'Sibiu': ['Arad', 'Oradea', 'Fagaras', 'Rimnicu Vilcea'],
-        'Timisoara': ['Arad', 'Lugoj'],
-        'Lugoj': ['Timisoara', 'Mehadia'],
-        'Mehadia': ['Lugoj', 'Drobeta'],
-        'Drobeta': ['Mehadia', 'Craiova'],
-        'Craiova': ['Drobeta', 'Rimnicu Vilcea', 'Pitesti'],
-        'Rimnicu Vilcea': ['Sibiu', 'Craiova', 'Pitesti'],
-        'Fagaras': ['Sibiu', 'Bucharest'],
-        'Pitesti': ['Rimnicu Vilcea', 'Craiova', 'Bucharest'],
-        'Bucharest': ['Fagaras', 'Pitesti', 'Giurgiu', 'Urziceni'],
-        'Giurgiu': ['Bucharest'],
-        'Urziceni': ['Bucharest', 'Hirsova', 'Vaslui'],
-        'Hirsova': ['Urziceni', 'Eforie'],
-        'Eforie': ['Hirsova'],
-        'Vaslui': ['Urziceni', 'Iasi'],
-        'Iasi': ['Vaslui', 'Neamt'],
-        'Neamt': ['Iasi']
+        'Arad': {'Zerind': 75, 'Sibiu': 140, 'Timisoara': 118},
+        'Zerind': {'Arad': 75, 'Oradea': 71},
+        'Oradea': {'Zerind': 71, 'Sibiu': 151},
+        'Sibiu': {'Arad': 140, 'Oradea': 151, 'Fagaras': 99, 'Rimnicu Vilcea': 80},
+        'Timisoara': {'Arad': 118, 'Lugoj': 111},
+        'Lugoj': {'Timisoara': 111, 'Mehadia': 70},
+        'Mehadia': {'Lugoj': 70, 'Drobeta': 75},
+        'Drobeta': {'Mehadia': 75, 'Craiova': 120},
+        'Craiova': {'Drobeta': 120, 'Rimnicu Vilcea': 146, 'Pitesti': 138},
+        'Rimnicu Vilcea': {'Sibiu': 80, 'Craiova': 146, 'Pitesti': 97},
+        'Fagaras': {'Sibiu': 99, 'Bucharest': 211},
+        'Pitesti': {'Rimnicu Vilcea': 97, 'Craiova': 138, 'Bucharest': 101},
+        'Bucharest': {'Fagaras': 211, 'Pitesti': 101, 'Giurgiu': 90, 'Urziceni': 85},
+        'Giurgiu': {'Bucharest': 90},
+        'Urziceni': {'Bucharest': 85, 'Hirsova': 98, 'Vaslui': 142},
+        'Hirsova': {'Urziceni': 98, 'Eforie': 86},
+        'Eforie': {'Hirsova': 86},
+        'Vaslui': {'Urziceni': 142, 'Iasi': 92},
+        'Iasi': {'Vaslui': 92, 'Neamt': 87},
+        'Neamt': {'Iasi': 87}
     }
     usc_visualization(city_graph_example, 'Arad', 'Bucharest')
@@ -1,89 +1,39 @@
-import heapq
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import imageio
 import os
-
-# 可视化并保存为图片帧
-def visualize_grid_to_file(grid, path=None, visited=None, filename='frame.png'):
-    rows, cols = len(grid), len(grid[0])
-    fig, ax = plt.subplots()
-    cmap = mcolors.ListedColormap(['white', 'black'])  # 白色表示可通行，黑色表示障碍物
-    bounds = [-0.5, 0.5, 1.5]
-    norm = mcolors.BoundaryNorm(bounds, cmap.N)
-
-    ax.imshow(grid, cmap=cmap, norm=norm)
-    ax.grid(which='major', color='gray', linestyle='-', linewidth=0.5)
-    ax.set_xticks([])
-    ax.set_yticks([])
-
-    # 可视化已访问节点
-    if visited:
-        for (x, y) in visited:
-            ax.add_patch(plt.Rectangle((y - 0.5, x - 0.5), 1, 1, color='blue', alpha=0.3))
-
-    # 可视化路径
-    if path:
-        for (x, y) in path:
-            ax.add_patch(plt.Rectangle((y - 0.5, x - 0.5), 1, 1, color='red', alpha=0.5))
-
-    plt.savefig(filename)  # 保存当前帧为图片
-    plt.close()
-
-# 贪婪搜索核心算法
-def greedy_search(grid, start, goal, gif_name='greedy_search.gif'):
-    def h(pos):
-        # 启发函数（曼哈顿距离）
-        return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
-
-    open_set = []  # 优先队列
-    heapq.heappush(open_set, (h(start), start))  # 将起点加入优先队列
-    came_from = {}  # 路径追踪
-    visited = set()  # 已访问节点
-    frames = []  # 存储帧文件路径
-
-    frame_dir = "4-GS/frames_greedy"  # 存储帧的目录
-    os.makedirs(frame_dir, exist_ok=True)
-
-    frame_count = 0
-    while open_set:
-        _, current = heapq.heappop(open_set)  # 取出优先级最高的节点
-        if current in visited:
-            continue
-        visited.add(current)
-
-        # 保存当前帧
-        frame_file = os.path.join(frame_dir, f"frame_{frame_count:03d}.png")
-        visualize_grid_to_file(grid, visited=visited, filename=frame_file)
-        frames.append(frame_file)
-        frame_count += 1
-
-        if current == goal:
-            # 找到目标节点，回溯路径
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            # 保存最终路径帧
-            frame_file = os.path.join(frame_dir, f"frame_{frame_count:03d}.png")
-            visualize_grid_to_file(grid, path[::-1], visited, filename=frame_file)
-            frames.append(frame_file)
-            break
-
-        # 遍历邻居节点
-        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if (0 <= neighbor[0] < len(grid)) and (0 <= neighbor[1] < len(grid[0])) and grid[neighbor[0]][neighbor[1]] == 0:
-                if neighbor not in visited:
-                    heapq.heappush(open_set, (h(neighbor), neighbor))
-                    came_from[neighbor] = current
-
-    # 将所有帧合成为 GIF
-    images = [imageio.v2.imread(frame) for frame in frames]
-    imageio.mimsave(gif_name, images, duration=0.2)
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from search_engine import SearchObserver, SearchTrace, greedy
+from animation import FrameSink, GridRenderer
+
+class GridFrameWriter(SearchObserver):
+    """每扩展一个节点就输出一帧：图像只建一次，每帧只改对应格子的状态"""
+    def __init__(self, grid, sink):
+        self.renderer = GridRenderer(grid)
+        self.sink = sink
+
+    def on_expand(self, node):
+        self.renderer.set_cells([node], GridRenderer.VISITED)
+        self.sink.add_frame(self.renderer.render())  # 保存当前帧
+
+    def on_path(self, path):
+        self.renderer.set_cells(path, GridRenderer.PATH)
+        self.sink.add_frame(self.renderer.render())  # 保存最终路径帧
+
+    def close(self):
+        self.renderer.close()
+
+# 贪婪搜索 + 生成 GIF
+def greedy_search(grid, start, goal, gif_name='greedy_search.gif', connectivity=4, heuristic=None):
+    # 搜索全速运行并记录事件轨迹，再把轨迹回放给观察者，增量渲染后流式写入 GIF
+    trace = SearchTrace()
+    result = greedy(grid, start, goal, observer=trace, connectivity=connectivity, heuristic=heuristic)
+    with FrameSink(gif_name, duration=0.2) as sink:
+        writer = GridFrameWriter(grid, sink)
+        trace.replay(writer)
+        writer.close()
     print(f"GIF 保存为 {gif_name}")
+    return result
 
 # 主程序
 def main():
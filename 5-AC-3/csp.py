@@ -0,0 +1,316 @@
+"""二元约束满足问题与弧相容
+
+变量按下标编号，所有取值也统一编号，每个变量的域是一个整数位集：
+第 k 位为 1 表示第 k 个取值还在域中。删值、判空、取交集都是几次位运算，
+整个问题的域就是一个 int 列表，int 不可变，复制列表即得到一份快照，
+回溯时不需要 deepcopy。
+
+约束可以是任意二元关系，建模时预先展开成支持表，传播时查表即可。
+约束图的邻接表在建模时只建一次，弧队列用「队列 + 集合」去重，
+某个变量的域被缩小后只需把指向它的弧重新入队，不再扫描全部弧。
+"""
+import time
+from collections import deque
+
+import numpy as np
+
+
+def _bits(mask):
+    """依次产生位集中为 1 的位的下标"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _allowed_matrix(relation, xs, ys):
+    """把一条约束的关系展开成布尔矩阵 allowed[a, b]，a、b 为两个变量初始域中的位置
+
+    relation 可以是 None(不相等)、可调用对象 relation(x, y)、
+    形状为 (len(xs), len(ys)) 的布尔 NumPy 数组，或允许的取值对 (x, y) 的集合。
+    """
+    shape = (len(xs), len(ys))
+    if isinstance(relation, np.ndarray):
+        allowed = relation.astype(bool)
+        if allowed.shape != shape:
+            raise ValueError(f"约束表的形状应为 {shape}: {allowed.shape}")
+        return allowed
+    if relation is None:
+        test = lambda x, y: x != y
+    elif callable(relation):
+        test = lambda x, y: bool(relation(x, y))
+    else:
+        pairs = set(relation)
+        test = lambda x, y: (x, y) in pairs
+    # 显式给出形状：某个域为空时仍是 (0, len(ys)) 或 (len(xs), 0) 的二维矩阵
+    allowed = np.zeros(shape, dtype=bool)
+    for a, x in enumerate(xs):
+        for b, y in enumerate(ys):
+            allowed[a, b] = test(x, y)
+    return allowed
+
+
+class CSP:
+    """变量、取值域和变量之间的二元约束
+
+    domains 为 {变量: 取值列表}；constraints 为约束列表，每条是 (xi, xj) 或 (xi, xj, relation)，
+    只有两个变量时表示「不相等」，relation 的写法见 _allowed_matrix。
+    同一对变量上的多条约束取交集。
+
+    建模时每条约束都预先展开成支持表：supports[(i, j)][a] 是 j 中与 i 取值 a 相容的取值位集，
+    传播时判断一个值有没有支持只需一次按位与，热循环里不再调用 Python 函数。
+    """
+
+    def __init__(self, domains, constraints):
+        self.variables = list(domains)
+        self.index = {x: i for i, x in enumerate(self.variables)}
+        # 所有变量的取值统一编号，按首次出现的顺序
+        self.values = []
+        self.value_index = {}
+        for values in domains.values():
+            for v in values:
+                if v not in self.value_index:
+                    self.value_index[v] = len(self.values)
+                    self.values.append(v)
+        initial = [list(values) for values in domains.values()]
+        self.domains = [self.encode(values) for values in initial]
+        self.neighbors = [[] for _ in self.variables]
+        self.supports = {}
+        self.not_equal = set()  # 纯「不相等」的弧，revise 可以走只看单值的捷径
+
+        for constraint in constraints:
+            xi, xj, *relation = constraint
+            if xi not in self.index or xj not in self.index:
+                raise ValueError(f"约束引用了未定义的变量: ({xi}, {xj})")
+            i, j = self.index[xi], self.index[xj]
+            if i == j:
+                raise ValueError(f"二元约束的两端不能是同一个变量: {xi}")
+            relation = relation[0] if relation else None
+            allowed = _allowed_matrix(relation, initial[i], initial[j])
+            fresh = j not in self.neighbors[i]
+            if fresh:
+                self.neighbors[i].append(j)
+                self.neighbors[j].append(i)
+            for arc, table, xs, ys in (((i, j), allowed, initial[i], initial[j]),
+                                       ((j, i), allowed.T, initial[j], initial[i])):
+                rows = self._support_rows(table, xs, ys)
+                if fresh:
+                    self.supports[arc] = rows
+                    if relation is None:
+                        self.not_equal.add(arc)
+                else:
+                    self.supports[arc] = [r & s for r, s in zip(self.supports[arc], rows)]
+                    self.not_equal.discard(arc)
+
+    def _support_rows(self, allowed, xs, ys):
+        """布尔矩阵 -> 按取值编号索引的支持位集列表"""
+        bits = [1 << self.value_index[y] for y in ys]
+        rows = [0] * len(self.values)
+        for a, x in enumerate(xs):
+            mask = 0
+            for b in np.flatnonzero(allowed[a]).tolist():
+                mask |= bits[b]
+            rows[self.value_index[x]] = mask
+        return rows
+
+    def encode(self, values):
+        """取值列表 -> 位集"""
+        mask = 0
+        for v in values:
+            mask |= 1 << self.value_index[v]
+        return mask
+
+    def decode(self, domains):
+        """位集列表 -> {变量: 取值列表}"""
+        return {x: [self.values[k] for k in _bits(mask)] for x, mask in zip(self.variables, domains)}
+
+    def arcs(self):
+        """全部有向弧 (i, j)，每条约束对应两条"""
+        return [(i, j) for i, nbrs in enumerate(self.neighbors) for j in nbrs]
+
+    def consistent(self, i, j, a, b):
+        """变量 i 取值 a、变量 j 取值 b 时是否满足它们之间的约束"""
+        return bool(self.supports[(i, j)][a] >> b & 1)
+
+
+def revise(csp, i, j, domains):
+    """删去 i 域中在 j 域里找不到支持的值，返回是否有删除
+
+    每个值查一次支持表即可；「不相等」约束更简单，j 的域至少有两个值时 i 的每个值都有支持，
+    只剩一个值时在 i 的域里删掉这个值，都是常数次位运算。
+    """
+    dj = domains[j]
+    if (i, j) in csp.not_equal:
+        if not dj:
+            # j 的域已空，i 的任何值都找不到支持
+            removed = domains[i] != 0
+            domains[i] = 0
+            return removed
+        if dj & (dj - 1):
+            return False
+        if domains[i] & dj:
+            domains[i] &= ~dj
+            return True
+        return False
+    rows = csp.supports[(i, j)]
+    removed = 0
+    for a in _bits(domains[i]):
+        if not rows[a] & dj:
+            removed |= 1 << a
+    if not removed:
+        return False
+    domains[i] &= ~removed
+    return True
+
+
+def _revise_2001(csp, i, j, domains, last):
+    """AC-2001 版 revise：记住每个值上一次找到的支持
+
+    上次的支持还在 j 的域里就直接通过；否则只在编号比它大的相容取值里找下一个支持，
+    借助支持表这一步也只是几次位运算。
+    """
+    rows = csp.supports[(i, j)]
+    dj = domains[j]
+    removed = 0
+    for a in _bits(domains[i]):
+        key = (i, a, j)
+        b = last.get(key)
+        if b is not None and dj >> b & 1:
+            continue
+        rest = dj & rows[a]
+        if b is not None:
+            rest &= ~((2 << b) - 1)
+        if rest:
+            last[key] = (rest & -rest).bit_length() - 1
+        else:
+            removed |= 1 << a
+    if not removed:
+        return False
+    domains[i] &= ~removed
+    return True
+
+
+def ac3(csp, domains=None, mode='ac3', on_arc=None, arcs=None):
+    """对 domains(位集列表，默认取 csp 的初始域)做弧相容
+
+    返回缩小后的位集列表(传入的列表不会被修改)，出现空域时返回 None。
+    mode 为 'ac3' 或 'ac2001'；on_arc(弧, 域) 在每处理完一条弧后调用，用于可视化。
+    arcs 为初始入队的弧，默认是全部弧；只改动了少数变量的域时传入指向它们的弧即可。
+    """
+    if mode == 'ac3':
+        revise_arc = revise
+        extra = ()
+    elif mode == 'ac2001':
+        revise_arc = _revise_2001
+        extra = ({},)
+    else:
+        raise ValueError(f"未知的弧相容算法: {mode}")
+    domains = list(csp.domains if domains is None else domains)
+    if not all(domains):
+        return None  # 传入时就有空域
+    neighbors = csp.neighbors
+
+    queue = deque(csp.arcs() if arcs is None else arcs)
+    queued = set(queue)  # 已在队列中的弧，避免重复入队
+    while queue:
+        arc = queue.popleft()
+        queued.discard(arc)
+        i, j = arc
+        if revise_arc(csp, i, j, domains, *extra):
+            if not domains[i]:
+                return None
+            # i 的域变小了，只有指向 i 的弧可能失去支持
+            for k in neighbors[i]:
+                if k != j and (k, i) not in queued:
+                    queue.append((k, i))
+                    queued.add((k, i))
+        if on_arc is not None:
+            on_arc(arc, domains)
+    return domains
+
+
+def _select_variable(csp, domains, assigned):
+    """MRV：选域最小的未赋值变量，相同时选与未赋值变量相连最多的(度启发式)"""
+    sizes = [(mask.bit_count(), i) for i, mask in enumerate(domains) if not assigned[i]]
+    if not sizes:
+        return None
+    smallest = min(sizes)[0]
+    # 只为域最小的几个候选计算度，其余变量不必数邻居
+    candidates = [i for size, i in sizes if size == smallest]
+    if len(candidates) == 1:
+        return candidates[0]
+    neighbors = csp.neighbors
+    return max(candidates, key=lambda i: sum(1 for k in neighbors[i] if not assigned[k]))
+
+
+def _order_values(csp, i, domains, assigned):
+    """LCV：按给邻居留下的选择从多到少排列取值，即排除邻居取值少的在前"""
+    supports = csp.supports
+
+    def ruled_out(a):
+        return sum((domains[k] & ~supports[(i, k)][a]).bit_count() for k in csp.neighbors[i] if not assigned[k])
+    return sorted(_bits(domains[i]), key=ruled_out)
+
+
+def solve(csp, mode='ac3', mrv=True, lcv=True):
+    """回溯搜索 + 维持弧相容(MAC)，返回 (解, 统计)
+
+    每给一个变量赋值，就只把指向它的弧入队做一次弧相容，出现空域立即回溯。
+    mrv/lcv 控制变量与取值的排序启发式。解为 {变量: 取值}，无解时为 None；
+    统计包括搜索节点数、回溯次数、弧相容调用次数和耗时(秒)。
+    """
+    stats = {'nodes': 0, 'backtracks': 0, 'propagations': 0, 'propagation_time': 0.0, 'time': 0.0}
+    start = time.perf_counter()
+    n = len(csp.variables)
+    assigned = bytearray(n)
+
+    def propagate(domains, arcs=None):
+        t = time.perf_counter()
+        domains = ac3(csp, domains, mode, arcs=arcs)
+        stats['propagations'] += 1
+        stats['propagation_time'] += time.perf_counter() - t
+        return domains
+
+    def select(domains):
+        if mrv:
+            return _select_variable(csp, domains, assigned)
+        return next((i for i in range(n) if not assigned[i]), None)
+
+    def order(i, domains):
+        return _order_values(csp, i, domains, assigned) if lcv else list(_bits(domains[i]))
+
+    def finish(domains):
+        stats['time'] = time.perf_counter() - start
+        if domains is None:
+            return None, stats
+        return {x: csp.values[mask.bit_length() - 1] for x, mask in zip(csp.variables, domains)}, stats
+
+    domains = propagate(None)
+    if domains is None:
+        return finish(None)
+    i = select(domains)
+    if i is None:
+        return finish(domains)
+    # 显式栈代替递归，变量很多时也不会超过递归深度；每层保存赋值前的域快照
+    assigned[i] = 1
+    stack = [(domains, i, iter(order(i, domains)))]
+    while stack:
+        domains, i, values = stack[-1]
+        a = next(values, None)
+        if a is None:
+            stack.pop()
+            assigned[i] = 0
+            stats['backtracks'] += 1
+            continue
+        stats['nodes'] += 1
+        child = list(domains)
+        child[i] = 1 << a
+        child = propagate(child, [(k, i) for k in csp.neighbors[i]])
+        if child is None:
+            continue
+        j = select(child)
+        if j is None:
+            return finish(child)
+        assigned[j] = 1
+        stack.append((child, j, iter(order(j, child))))
+    return finish(None)
@@ -1,9 +1,11 @@
 import matplotlib.pyplot as plt
 import networkx as nx
-import imageio
 import os
-from collections import deque
-from copy import deepcopy
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from animation import FrameSink
+from csp import CSP, ac3 as propagate, solve
 
 # 初始变量域
 domains = {
@@ -17,29 +19,14 @@ domains = {
 }
 
 # 变量之间的约束关系（无向图）
+# 每条约束写成 (xi, xj) 表示相邻不同色，也可以写成 (xi, xj, 关系)，
+# 关系可以是函数 f(x, y)、布尔 NumPy 表或允许的取值对集合
 edges = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
 
-# 双向加入所有弧
-def get_all_arcs(edges):
-    return deque([(xi, xj) for xi, xj in edges] + [(xj, xi) for xi, xj in edges])
-
-# 判断是否一致（不允许相邻同色）
-def revise(xi, xj, domains):
-    revised = False
-    new_domain = []
-    for x in domains[xi]:
-        if any(x != y for y in domains[xj]):
-            new_domain.append(x)
-        else:
-            revised = True
-    if revised:
-        domains[xi] = new_domain
-    return revised
-
-# 可视化函数
+# 可视化函数：绘制一帧，返回 matplotlib 图像
 def draw_graph(domains, step, removed_arc=None):
     G = nx.Graph()
-    G.add_edges_from(edges)
+    G.add_edges_from((c[0], c[1]) for c in edges)
     pos = nx.spring_layout(G, seed=42)
 
     color_map = {'R': 'red', 'G': 'green', 'B': 'blue'}
@@ -58,45 +45,35 @@ def draw_graph(domains, step, removed_arc=None):
     if removed_arc:
         nx.draw_networkx_edges(G, pos, edgelist=[removed_arc], width=2.5, edge_color="red")
 
-    filename = f"ac3_step_{step}.png"
-    plt.savefig(filename)
-    plt.close()
-    return filename
+    return fig
 
-# AC-3 主过程
-def ac3(domains, edges):
-    queue = get_all_arcs(edges)
+# AC-3 主过程，sink 为帧接收器；为 None 时不做任何绘图
+# 约束图的邻接表在 CSP 中只建一次，域以位集表示；mode='ac2001' 时记住每个值上次找到的支持
+def ac3(domains, edges, sink=None, mode='ac3'):
+    csp = CSP(domains, edges)
     step = 0
-    frames = []
-    domains = deepcopy(domains)
 
-    frames.append(draw_graph(domains, step))
+    if sink is not None:
+        sink.add_figure(draw_graph(csp.decode(csp.domains), step))
     step += 1
 
-    while queue:
-        xi, xj = queue.popleft()
-        if revise(xi, xj, domains):
-            if not domains[xi]:
-                print(f"Domain wiped out at {xi}, inconsistency found.")
-                return None
-            for xk, _ in filter(lambda arc: arc[1] == xi and arc[0] != xj, get_all_arcs(edges)):
-                queue.append((xk, xi))
-        frames.append(draw_graph(domains, step, removed_arc=(xi, xj)))
+    def on_arc(arc, current):
+        nonlocal step
+        xi, xj = (csp.variables[k] for k in arc)
+        sink.add_figure(draw_graph(csp.decode(current), step, removed_arc=(xi, xj)))
         step += 1
 
-    return domains, frames
-
-# 生成GIF
-def make_gif(frames, output='ac3_visual.gif'):
-    images = [imageio.imread(frame) for frame in frames]
-    imageio.mimsave(output, images, fps=1)
-    for frame in frames:
-        os.remove(frame)
+    result = propagate(csp, mode=mode, on_arc=on_arc if sink is not None else None)
+    if result is None:
+        print("Domain wiped out, inconsistency found.")
+        return None
+    return csp.decode(result)
 
 # 主函数
 def main():
-    result, frames = ac3(domains, edges)
-    make_gif(frames)
+    # 每一帧渲染后直接流式写入GIF，不再生成中间PNG文件
+    with FrameSink('ac3_visual.gif', fps=1) as sink:
+        result = ac3(domains, edges, sink)
     print("AC-3 可视化生成完毕：ac3_visual.gif")
     if result:
         print("最终域：")
@@ -105,5 +82,16 @@ def main():
     else:
         print("存在冲突，无法满足约束。")
 
+    # 单轮弧相容只缩小域，真正给出着色还要在每个节点维持弧相容的回溯搜索
+    solution, stats = solve(CSP(domains, edges))
+    if solution:
+        print("一组可行着色：")
+        for k, v in solution.items():
+            print(f"{k}: {v}")
+    else:
+        print("回溯搜索确认无解。")
+    print(f"搜索节点 {stats['nodes']} 个，回溯 {stats['backtracks']} 次，"
+          f"弧相容 {stats['propagations']} 次共 {stats['propagation_time'] * 1000:.2f} ms")
+
 if __name__ == "__main__":
     main()
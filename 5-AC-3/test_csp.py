@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from csp import CSP, ac3, revise, solve
+
+
+def test_empty_domain_wipes_out():
+    csp = CSP({'A': ['R'], 'B': ['R', 'G']}, [('A', 'B')])
+    for mode in ('ac3', 'ac2001'):
+        assert ac3(csp, [csp.domains[0], 0], mode) is None
+    # 不相等约束的捷径：j 的域为空时 i 的值全部失去支持
+    domains = [csp.domains[0], 0]
+    assert revise(csp, 0, 1, domains)
+    assert domains[0] == 0
+
+
+def test_empty_initial_domain_without_constraints():
+    csp = CSP({'A': [], 'B': ['R', 'G']}, [])
+    assert ac3(csp) is None
+    assert solve(csp)[0] is None
+
+
+def test_empty_domain_with_constraint():
+    relations = [None, lambda x, y: x != y, {('R', 'G'), ('G', 'R')}]
+    for relation in relations:
+        for domains in ({'A': [], 'B': ['R', 'G']}, {'A': ['R', 'G'], 'B': []}):
+            constraint = ('A', 'B') if relation is None else ('A', 'B', relation)
+            csp = CSP(domains, [constraint])
+            assert ac3(csp) is None
+            assert solve(csp)[0] is None
@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import os, imageio
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from animation import FrameSink
+from game_engine import ConnectFour, TicTacToe, TreeGame, minimax as engine_minimax
+from game_engine.benchmark import benchmark
 
 class Node:
     def __init__(self, value, children=None, name=""):
@@ -8,16 +13,13 @@ class Node:
         self.children = children or []
         self.name = name
 
-# Minimax without pruning
-def minimax(node, depth, maximizingPlayer, path=[], frames=[]):
-    path.append(node)
-    fig, ax = plt.subplots()
-    draw_tree(node, highlight=path, ax=ax)
-    os.makedirs("6-minimax/frames_minimax", exist_ok=True)
-    filename = f"6-minimax/frames_minimax/frame_{len(frames):03d}.png"
-    fig.savefig(filename)
-    plt.close()
-    frames.append(filename)
+# Minimax without pruning; frames go straight into `sink`, no rendering when sink is None
+def minimax(node, depth, maximizingPlayer, path=None, sink=None):
+    path = (path or []) + [node]
+    if sink is not None:
+        fig, ax = plt.subplots()
+        draw_tree(node, highlight=path, ax=ax)
+        sink.add_figure(fig)
 
     if depth == 0 or not node.children:
         return node.value
@@ -25,12 +27,12 @@ def minimax(node, depth, maximizingPlayer, path=[], frames=[]):
     if maximizingPlayer:
         value = float('-inf')
         for child in node.children:
-            value = max(value, minimax(child, depth - 1, False, path[:], frames))
+            value = max(value, minimax(child, depth - 1, False, path, sink))
         return value
     else:
         value = float('inf')
         for child in node.children:
-            value = min(value, minimax(child, depth - 1, True, path[:], frames))
+            value = min(value, minimax(child, depth - 1, True, path, sink))
         return value
 
 # Draw the tree
@@ -70,14 +72,17 @@ def create_tree():
 
 # Run minimax and save GIF
 def run_minimax():
-    os.makedirs("frames_minimax", exist_ok=True)
     root = create_tree()
-    frames = []
-    minimax(root, 3, True, [], frames)
-
-    images = [imageio.v2.imread(f) for f in frames]
-    imageio.mimsave("minimax.gif", images, duration=0.8)
+    with FrameSink("minimax.gif", duration=0.8) as sink:
+        minimax(root, 3, True, sink=sink)
     print("Minimax GIF saved as minimax.gif")
 
+    # The same search on real games, through the render-free engine
+    print("Engine on the demo tree:", engine_minimax(TreeGame(root), 3).value)
+    for name, game, depth in (("Tic-tac-toe", TicTacToe(), 9), ("Connect-Four", ConnectFour(), 5)):
+        info, seconds, nps = benchmark(game, depth, 'minimax')
+        print(f"{name} depth {depth}: best move {info.move}, value {info.value}, "
+              f"{info.nodes} nodes in {seconds:.2f}s ({nps:,.0f} nodes/s)")
+
 if __name__ == "__main__":
     run_minimax()
\ No newline at end of file
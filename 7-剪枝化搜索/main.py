@@ -1,6 +1,13 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import os, imageio
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from animation import FrameSink
+from game_engine import ConnectFour, Searcher, TreeGame, alphabeta as engine_alphabeta
+from game_engine.negamax import mtdf, pvs
+from game_engine.parallel import root_parallel
+from game_engine.table import TranspositionTable
 
 class Node:
     def __init__(self, value, children=None, name=""):
@@ -8,37 +15,33 @@ class Node:
         self.children = children or []
         self.name = name
 
-# Minimax with alpha-beta pruning
-def alphabeta(node, depth, alpha, beta, maximizingPlayer, path=[], frames=[]):
-    path.append(node)
-    fig, ax = plt.subplots()
-    draw_tree(node, highlight=path, ax=ax)
-    os.makedirs("7-剪枝化搜索/frames_minimax", exist_ok=True)
-    filename = f"7-剪枝化搜索/frames_minimax/frame_{len(frames):03d}.png"
-    filename = f"frames_alpha_beta/frame_{len(frames):03d}.png"
-    fig.savefig(filename)
-    plt.close()
-    frames.append(filename)
+# Alpha-beta in negamax form: every node maximizes the score from the side to move
+# (color = +1 for MAX, -1 for MIN), so one loop serves both players.
+# Frames go straight into `sink`, no rendering when sink is None
+def negamax(node, depth, alpha, beta, color, path=None, sink=None):
+    path = (path or []) + [node]
+    if sink is not None:
+        fig, ax = plt.subplots()
+        draw_tree(node, highlight=path, ax=ax)
+        sink.add_figure(fig)
 
     if depth == 0 or not node.children:
-        return node.value
+        return color * node.value
 
+    value = float('-inf')
+    for child in node.children:
+        # The child's score for its own side to move, negated, is our score; the window flips too
+        value = max(value, -negamax(child, depth - 1, -beta, -alpha, -color, path, sink))
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break  # cutoff
+    return value
+
+# Minimax value of `node` (from MAX's point of view) with alpha-beta pruning
+def alphabeta(node, depth, alpha, beta, maximizingPlayer, path=None, sink=None):
     if maximizingPlayer:
-        value = float('-inf')
-        for child in node.children:
-            value = max(value, alphabeta(child, depth - 1, alpha, beta, False, path[:], frames))
-            alpha = max(alpha, value)
-            if beta <= alpha:
-                break  # β剪枝
-        return value
-    else:
-        value = float('inf')
-        for child in node.children:
-            value = min(value, alphabeta(child, depth - 1, alpha, beta, True, path[:], frames))
-            beta = min(beta, value)
-            if beta <= alpha:
-                break  # α剪枝
-        return value
+        return negamax(node, depth, alpha, beta, 1, path, sink)
+    return -negamax(node, depth, -beta, -alpha, -1, path, sink)
 
 # Draw the tree
 def draw_tree(node, x=0, y=0, dx=3, dy=-2, ax=None, highlight=[]):
@@ -77,14 +80,35 @@ def create_tree():
 
 # Run Alpha-Beta and save GIF
 def run_alpha_beta():
-    os.makedirs("frames_alpha_beta", exist_ok=True)
     root = create_tree()
-    frames = []
-    alphabeta(root, 3, float('-inf'), float('inf'), True, [], frames)
-
-    images = [imageio.v2.imread(f) for f in frames]
-    imageio.mimsave("alpha_beta.gif", images, duration=0.8)
+    with FrameSink("alpha_beta.gif", duration=0.8) as sink:
+        alphabeta(root, 3, float('-inf'), float('inf'), True, sink=sink)
     print("Alpha-Beta GIF saved as alpha_beta.gif")
 
+    # Render-free engine: same tree, then a real Connect-Four position with and without
+    # a Zobrist transposition table (positions reached by different move orders are searched once)
+    print("Engine on the demo tree:", engine_alphabeta(TreeGame(root), 3).value)
+    for tt in (None, TranspositionTable()):
+        info = engine_alphabeta(ConnectFour(), 9, tt=tt)
+        label = "with TT" if tt is not None else "no TT"
+        print(f"Connect-Four depth 9 ({label}): best move {info.move}, value {info.value:g}, {info.nodes} nodes")
+
+    # Null-window variants on the same position: PVS re-searches only when a later move
+    # beats the first one, MTD(f) converges on the value through zero-width probes of the TT
+    for name, search in (("PVS", pvs), ("MTD(f)", mtdf)):
+        info = search(ConnectFour(), 9, tt=TranspositionTable())
+        print(f"Connect-Four depth 9 ({name} with TT): best move {info.move}, value {info.value:g}, {info.nodes} nodes")
+
+    # Root moves split across worker processes that share the best proven bound;
+    # value and move are the same as the sequential search whatever the process count
+    info = root_parallel(ConnectFour(), 9)
+    print(f"Connect-Four depth 9 (root-parallel, {info.stats['processes']} processes): "
+          f"best move {info.move}, value {info.value:g}, {info.nodes} nodes")
+
+    # Iterative deepening under a wall-clock budget, with PV/killer/history ordering and aspiration windows
+    info = Searcher().search(ConnectFour(), time_limit=1.0)
+    print(f"Connect-Four, 1s budget: reached depth {info.depth}, best move {info.move}, "
+          f"value {info.value:g}, {info.nodes} nodes, PV {info.stats['pv']}")
+
 if __name__ == "__main__":
     run_alpha_beta()
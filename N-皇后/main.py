@@ -1,34 +1,23 @@
-
 from rich import print as rprint
-def solveNQueens(n: int) -> list[list[str]]:
-    result = []
-    col = [0]*n
+from nqueens import board, count_solutions, iter_solutions
+from min_conflicts import is_solution, min_conflicts
 
-    def valid(r,c):
-        for R in range(r):
-            C =  col[R]
-            if r + c == R + C or r - c == R - C:
-                return False
-        return True
 
-    def dfs(r,s):
-        if r == n:
-            result.append(['.'*c + 'Q' + '.'*(n-c-1) for c in col])
-            return
-        for c in s:
-            if valid(r,c):
-                col[r] = c
-                dfs(r+1,s-{c})
-    
-    dfs(0,set(range(n)))
-    return result
+def solveNQueens(n: int) -> list[list[str]]:
+    # 位运算回溯，列和两条对角线的占用情况各用一个整数表示
+    return [board(cols) for cols in iter_solutions(n)]
 
 if __name__ == '__main__':
     n = 10
-    result = solveNQueens(n)
-    for index,i in enumerate(result):
+    print(f"{n}皇后共有{count_solutions(n)}个解")
+    # 解由生成器逐个产生，打印时不需要先把所有棋盘存下来
+    for index, cols in enumerate(iter_solutions(n)):
         print(f"\n第{index+1}个情况：\n")
-        for j in i:
+        for j in board(cols):
             rprint(j)
-            
 
+    # 回溯法对上千个皇后已无能为力，改用最小冲突局部搜索只找一个解
+    big = 100000
+    queens = min_conflicts(big)
+    if queens is not None:
+        print(f"\n{big}皇后由最小冲突法找到一个解(前10行的列号)：{queens[:10].tolist()}，校验：{is_solution(queens)}")
@@ -0,0 +1,102 @@
+"""最小冲突局部搜索版 N 皇后
+
+回溯法在 n 上千时就找不到解了。这里不做系统搜索，而是先贪心地放好每一行，
+再反复挑一个有冲突的皇后，把它移到本行冲突最少的列上，直到没有冲突。
+每列、每条主对角线、每条副对角线上的皇后数各存一个计数数组，
+判断冲突是 O(1)，为一行所有列打分是一次 NumPy 向量运算，内存始终是 O(n)。
+只找一个解，不保证一定找到。
+"""
+import random
+
+import numpy as np
+
+
+def _greedy_start(n, rng, tries=128):
+    """按行贪心的初始放置：各行列号取自一个随机排列，列之间天然不冲突
+
+    每行从排列剩余部分随机抽几次，选第一个两条对角线都空着的列；
+    绝大多数行一次就能放好，冲突只会集中在最后少数几行。
+    """
+    perm = list(range(n))
+    rng.shuffle(perm)
+    diag = [0] * (2 * n - 1)  # r + c 相同的主对角线
+    anti = [0] * (2 * n - 1)  # r - c 相同的副对角线，下标加 n - 1
+    randrange = rng.randrange
+    for r in range(n):
+        for _ in range(tries):
+            j = randrange(r, n)
+            c = perm[j]
+            if not diag[r + c] and not anti[r - c + n - 1]:
+                break
+        perm[r], perm[j] = c, perm[r]
+        diag[r + c] += 1
+        anti[r - c + n - 1] += 1
+    return perm, diag, anti
+
+
+def is_solution(cols):
+    """检查每行皇后所在的列是否构成一个合法解"""
+    cols = np.asarray(cols, dtype=np.int64)
+    n = len(cols)
+    rows = np.arange(n)
+    return (len(np.unique(cols)) == n and len(np.unique(rows + cols)) == n
+            and len(np.unique(rows - cols)) == n)
+
+
+def _repair(n, perm, diag, anti, max_steps, rng):
+    """从一个初始放置出发反复移动冲突皇后，max_steps 步内消除全部冲突则返回解，否则返回 None"""
+    queens = np.array(perm, dtype=np.int64)
+    col_count = np.ones(n, dtype=np.int32)
+    diag = np.array(diag, dtype=np.int32)
+    anti = np.array(anti, dtype=np.int32)
+    rows = np.arange(n)
+
+    steps = 0
+    while True:
+        # 每轮整体扫描一次找出有冲突的行，新产生的冲突留到下一轮再处理
+        conflicted = np.flatnonzero((col_count[queens] > 1) | (diag[rows + queens] > 1)
+                                    | (anti[rows - queens + n - 1] > 1))
+        if len(conflicted) == 0:
+            return queens
+        rng.shuffle(conflicted)
+        for r in conflicted.tolist():
+            c = int(queens[r])
+            if col_count[c] == 1 and diag[r + c] == 1 and anti[r - c + n - 1] == 1:
+                continue  # 之前的移动已经消除了这一行的冲突
+            if steps >= max_steps:
+                return None
+            steps += 1
+            # 先拿掉本行的皇后，再给本行每一列打分：列上、两条对角线上已有的皇后数之和
+            col_count[c] -= 1
+            diag[r + c] -= 1
+            anti[r - c + n - 1] -= 1
+            score = col_count + diag[r:r + n] + anti[r:r + n][::-1]
+            best = np.flatnonzero(score == score.min())
+            c = int(best[rng.integers(len(best))])  # 并列时随机选，避免在平台上来回打转
+            queens[r] = c
+            col_count[c] += 1
+            diag[r + c] += 1
+            anti[r - c + n - 1] += 1
+
+
+def min_conflicts(n, max_steps=10000, seed=None):
+    """用最小冲突法找一个 n 皇后的解，返回每行皇后所在列的 NumPy 数组
+
+    修复陷入局部极小时会重新随机放置再试，max_steps 为总共最多移动皇后的次数，
+    用完仍有冲突时返回 None。
+    """
+    if n < 1:
+        raise ValueError(f"皇后数至少为 1: {n}")
+    if n in (2, 3):
+        return None  # 无解
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    # 一次修复正常只需要几十步，超过这个步数多半卡在了局部极小
+    restart_every = 100 + n // 100
+    while max_steps > 0:
+        budget = min(restart_every, max_steps)
+        queens = _repair(n, *_greedy_start(n, rng), budget, np_rng)
+        if queens is not None:
+            return queens
+        max_steps -= budget
+    return None
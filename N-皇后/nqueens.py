@@ -0,0 +1,190 @@
+"""位运算版 N 皇后
+
+列、主对角线、副对角线的占用情况各用一个整数的二进制位表示，
+第 k 位为 1 表示第 k 列(或经过该列的对角线)已被占用，
+判断能否放置只需一次按位或，不再逐行检查。
+解用「每行皇后所在列」的元组表示，需要时再转成棋盘字符串。
+"""
+import numpy as np
+
+# 计数时每批同时扩展的部分解个数上限，决定内存占用的峰值
+_CHUNK = 1 << 15
+
+# 计数使用 int64 位运算，列数不能超过 62
+MAX_COUNT_N = 62
+
+
+def board(cols):
+    """列号元组 -> 棋盘字符串列表"""
+    n = len(cols)
+    return ['.' * c + 'Q' + '.' * (n - c - 1) for c in cols]
+
+
+def _first_rows(n):
+    """按左右镜像对称拆分第一行：(第一行可选列的位掩码, 是否需要补上镜像解)
+
+    第一行皇后在左半边的解与在右半边的解一一镜像对应，只搜索左半边再翻倍；
+    n 为奇数时中间一列单独搜索，它的镜像仍落在中间一列，不能翻倍。
+    """
+    half = (1 << (n // 2)) - 1
+    parts = []
+    if half:
+        parts.append((half, True))
+    if n % 2:
+        parts.append((1 << (n // 2), False))
+    return parts
+
+
+def _iter_from(n, first, prefix=(), cols=0, ld=0, rd=0):
+    """从已放好前 len(prefix) 行的部分解出发，当前行只在位掩码 first 内选列，
+    按列号从小到大逐个产生完整解
+    """
+    mask = (1 << n) - 1
+    start = len(prefix)
+    placed = [1 << c for c in prefix] + [0] * (n - start)
+    avail = [0] * n
+    cs, ls, rs = [0] * n, [0] * n, [0] * n
+    avail[start] = first
+    cs[start], ls[start], rs[start] = cols, ld, rd
+    row = start
+    while row >= start:
+        a = avail[row]
+        if not a:
+            row -= 1
+            continue
+        bit = a & -a  # 取最低位的可选列
+        avail[row] = a ^ bit
+        placed[row] = bit
+        if row == n - 1:
+            yield tuple(b.bit_length() - 1 for b in placed)
+            continue
+        c = cs[row] | bit
+        l = ((ls[row] | bit) << 1) & mask
+        r = (rs[row] | bit) >> 1
+        row += 1
+        cs[row], ls[row], rs[row] = c, l, r
+        avail[row] = ~(c | l | r) & mask
+
+
+def _split(n, depth, symmetry=True):
+    """把搜索树的前 depth 行展开成互相独立的子问题
+
+    产生 (前缀列号元组, 下一行可选列的位掩码, 列占用, 主对角线, 副对角线, 是否需要补上镜像解)，
+    前缀已经放满 n 行时可选列掩码为 0；第一行仍按镜像对称只取左半边和中间一列。
+    """
+    mask = (1 << n) - 1
+    parts = _first_rows(n) if symmetry else [(mask, False)]
+    for first, mirrored in parts:
+        stack = [((), first, 0, 0, 0)]
+        while stack:
+            prefix, avail, c, l, r = stack.pop()
+            if len(prefix) == depth or len(prefix) == n:
+                yield prefix, avail, c, l, r, mirrored
+                continue
+            children = []
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                cc, ll, rr = c | bit, ((l | bit) << 1) & mask, (r | bit) >> 1
+                children.append((prefix + (bit.bit_length() - 1,), ~(cc | ll | rr) & mask, cc, ll, rr))
+            stack.extend(reversed(children))
+
+
+def iter_solutions(n, symmetry=True):
+    """惰性地逐个产生 n 皇后的解，每个解是每行皇后所在列的元组
+
+    内存只和 n 有关，与解的个数无关。symmetry=True 时只搜索第一行在左半边的解，
+    每找到一个就同时给出它的镜像，搜索量减半，但解不再按字典序出现。
+    """
+    if n < 0:
+        raise ValueError(f"皇后数不能为负: {n}")
+    if n == 0:
+        yield ()
+        return
+    if not symmetry:
+        yield from _iter_from(n, (1 << n) - 1)
+        return
+    for first, mirrored in _first_rows(n):
+        for cols in _iter_from(n, first):
+            yield cols
+            if mirrored:
+                yield tuple(n - 1 - c for c in cols)
+
+
+def _popcount(a):
+    """逐元素统计非负整数数组中 1 的个数
+
+    NumPy 2 直接用 bitwise_count；NumPy 1.x 没有它，改用 SWAR：
+    先两位一组、再四位一组地并行求和，最后乘法把各字节的计数累加到最高字节。
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(a)
+    u64 = np.uint64
+    a = a.astype(u64)
+    a = a - ((a >> u64(1)) & u64(0x5555555555555555))
+    a = (a & u64(0x3333333333333333)) + ((a >> u64(2)) & u64(0x3333333333333333))
+    a = (a + (a >> u64(4))) & u64(0x0F0F0F0F0F0F0F0F)
+    return (a * u64(0x0101010101010101)) >> u64(56)
+
+
+def _count_frontier(n, row, cols, ld, rd):
+    """从第 row 行的一批部分解出发，统计能补全的解的个数
+
+    同一层的部分解存放在 NumPy 数组里整体扩展：每轮取出所有部分解的最低可选位，
+    一次生成一整层子节点；为控制内存，批量过大时先对半拆开，按深度优先处理。
+    """
+    mask = cols.dtype.type((1 << n) - 1)
+    total = 0
+    stack = [(row, cols, ld, rd)]
+    while stack:
+        row, cols, ld, rd = stack.pop()
+        if len(cols) > _CHUNK:
+            half = len(cols) // 2
+            stack.append((row, cols[half:], ld[half:], rd[half:]))
+            stack.append((row, cols[:half], ld[:half], rd[:half]))
+            continue
+        avail = ~(cols | ld | rd) & mask
+        if row == n - 1:
+            # 最后一行每个可选位都对应一个完整解
+            total += int(_popcount(avail).sum())
+            continue
+        children = ([], [], [])
+        while True:
+            live = avail != 0
+            if not live.any():
+                break
+            cols, ld, rd, avail = cols[live], ld[live], rd[live], avail[live]
+            bit = avail & -avail
+            avail ^= bit
+            children[0].append(cols | bit)
+            children[1].append(((ld | bit) << 1) & mask)
+            children[2].append((rd | bit) >> 1)
+        if children[0]:
+            stack.append((row + 1, *(np.concatenate(c) for c in children)))
+    return total
+
+
+def count_solutions(n, symmetry=True):
+    """只统计解的个数，不生成任何棋盘
+
+    symmetry=True 时利用左右镜像对称只搜索一半。
+    """
+    if n < 0:
+        raise ValueError(f"皇后数不能为负: {n}")
+    if n > MAX_COUNT_N:
+        raise ValueError(f"计数最多支持 n <= {MAX_COUNT_N}: {n}")
+    if n == 0:
+        return 1
+    parts = _first_rows(n) if symmetry else [((1 << n) - 1, False)]
+    # n 不超过 30 时用 int32，数组减半，带宽也减半
+    dtype = np.int32 if n <= 30 else np.int64
+    total = 0
+    for first, mirrored in parts:
+        # 第一行的每个可选列各作为一个部分解
+        bits = np.array([1 << c for c in range(n) if first >> c & 1], dtype=dtype)
+        if n == 1:
+            count = len(bits)
+        else:
+            count = _count_frontier(n, 1, bits, (bits << 1) & ((1 << n) - 1), bits >> 1)
+        total += 2 * count if mirrored else count
+    return total
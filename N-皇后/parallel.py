@@ -0,0 +1,84 @@
+"""多进程 N 皇后
+
+把搜索树的前一两行展开成互相独立的子问题，分发给进程池：
+每个任务只传几个整数(前缀和三个位掩码)，计数时只回传一个整数，
+枚举时按子问题分批回传解，主进程边收边产出。
+"""
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from nqueens import MAX_COUNT_N, _count_frontier, _iter_from, _split
+
+
+def _count_task(task):
+    """在工作进程中统计一个子问题的解数"""
+    n, prefix, avail, cols, ld, rd = task
+    row = len(prefix)
+    if row == n:
+        return 1
+    dtype = np.int32 if n <= 30 else np.int64
+    as_array = lambda x: np.array([x], dtype=dtype)
+    return _count_frontier(n, row, as_array(cols), as_array(ld), as_array(rd))
+
+
+def _solve_task(task):
+    """在工作进程中枚举一个子问题的全部解"""
+    n, prefix, avail, cols, ld, rd = task
+    if len(prefix) == n:
+        return [prefix]
+    return list(_iter_from(n, avail, prefix, cols, ld, rd))
+
+
+def _solve_indexed(item):
+    """带任务序号的 _solve_task，供 imap_unordered 使用"""
+    k, task = item
+    return k, _solve_task(task)
+
+
+def _tasks(n, depth, symmetry):
+    """子问题列表 [(任务, 是否需要补上镜像解)]"""
+    if n < 0:
+        raise ValueError(f"皇后数不能为负: {n}")
+    if depth < 1:
+        raise ValueError(f"展开的行数至少为 1: {depth}")
+    return [((n, prefix, avail, c, l, r), mirrored)
+            for prefix, avail, c, l, r, mirrored in _split(n, depth, symmetry)]
+
+
+def count_solutions_parallel(n, processes=None, depth=2, symmetry=True):
+    """多进程统计 n 皇后的解数
+
+    depth 为展开成子问题的行数，1 行只有约 n/2 个子问题，2 行约 n²/2 个，
+    子问题越多负载越均衡。
+    """
+    if n > MAX_COUNT_N:
+        raise ValueError(f"计数最多支持 n <= {MAX_COUNT_N}: {n}")
+    if n == 0:
+        return 1
+    tasks = _tasks(n, depth, symmetry)
+    weights = [2 if mirrored else 1 for _, mirrored in tasks]
+    with Pool(processes or os.cpu_count()) as pool:
+        counts = pool.map(_count_task, [task for task, _ in tasks], chunksize=1)
+    return sum(w * c for w, c in zip(weights, counts))
+
+
+def iter_solutions_parallel(n, processes=None, depth=2, symmetry=True):
+    """多进程枚举 n 皇后的解，子问题完成一个就产出一批
+
+    解的先后顺序取决于子问题完成的先后，不固定。
+    """
+    if n == 0:
+        yield ()
+        return
+    tasks = _tasks(n, depth, symmetry)
+    with Pool(processes or os.cpu_count()) as pool:
+        # 任务序号随结果一起返回，用来查是否需要补上镜像解
+        results = pool.imap_unordered(_solve_indexed, list(enumerate(task for task, _ in tasks)))
+        for k, solutions in results:
+            mirrored = tasks[k][1]
+            for cols in solutions:
+                yield cols
+                if mirrored:
+                    yield tuple(n - 1 - c for c in cols)
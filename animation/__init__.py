@@ -0,0 +1,13 @@
+"""流式动画输出
+
+把 matplotlib 图像直接渲染成内存中的 RGB 帧，逐帧写入 GIF/MP4，
+不再把每一帧存成 PNG 再整体读回内存。
+"""
+from .gif import GifStreamWriter
+from .sink import FrameSink, figure_to_rgb
+from .renderer import IncrementalRenderer, GridRenderer, GraphRenderer
+
+__all__ = [
+    'GifStreamWriter', 'FrameSink', 'figure_to_rgb',
+    'IncrementalRenderer', 'GridRenderer', 'GraphRenderer',
+]
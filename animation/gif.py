@@ -0,0 +1,79 @@
+import io
+import struct
+
+from PIL import Image
+
+
+def _skip_sub_blocks(data, pos):
+    """跳过一串数据子块，返回终止块之后的位置"""
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+class GifStreamWriter:
+    """增量写出的 GIF89a 编码器
+
+    每一帧单独用 Pillow 量化并做 LZW 压缩，再把压缩后的图像块
+    连同各自的局部调色板追加到输出文件，因此内存中始终只有当前一帧。
+    (Pillow/imageio 自带的 GIF 写入会把所有帧缓存到关闭时才一起编码。)
+    """
+
+    def __init__(self, path, duration=0.2, loop=0):
+        self.file = open(path, 'wb')
+        self.delay = max(1, round(duration * 100))  # GIF 以 1/100 秒为单位
+        self.loop = loop
+        self.size = None
+        self.frames = 0
+
+    def _write_header(self, width, height):
+        self.size = (width, height)
+        self.file.write(b'GIF89a')
+        # 逻辑屏幕描述符：不使用全局调色板，每帧自带局部调色板
+        self.file.write(struct.pack('<HHBBB', width, height, 0, 0, 0))
+        # NETSCAPE2.0 扩展：循环播放
+        self.file.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00')
+
+    def append(self, rgb):
+        """追加一帧，rgb 为 (高, 宽, 3) 的 uint8 数组"""
+        image = Image.fromarray(rgb).convert('RGB')
+        if self.size is None:
+            self._write_header(*image.size)
+        elif image.size != self.size:
+            image = image.resize(self.size)
+        buffer = io.BytesIO()
+        image.quantize(colors=256).save(buffer, format='GIF')
+        data = buffer.getvalue()
+
+        # 从单帧 GIF 中取出全局调色板，改作本帧的局部调色板
+        packed = data[10]
+        palette_bits = packed & 0x07
+        palette_end = 13 + (3 * (2 << palette_bits) if packed & 0x80 else 0)
+        palette = data[13:palette_end]
+
+        pos = palette_end
+        while data[pos] == 0x21:  # 跳过 Pillow 写入的扩展块
+            pos = _skip_sub_blocks(data, pos + 2)
+        if data[pos] != 0x2C:
+            raise ValueError("无法解析 Pillow 生成的 GIF 帧")
+        left, top, width, height, local = struct.unpack('<HHHHB', data[pos + 1:pos + 10])
+        pos += 10
+        if local & 0x80:  # Pillow 偶尔直接写局部调色板
+            palette_bits = local & 0x07
+            palette = data[pos:pos + 3 * (2 << palette_bits)]
+            pos += len(palette)
+        image_data_end = _skip_sub_blocks(data, pos + 1)
+
+        # 图形控制扩展：帧延时，处置方式为保留上一帧
+        self.file.write(b'\x21\xf9\x04\x04' + struct.pack('<H', self.delay) + b'\x00\x00')
+        # 保留 Pillow 设置的隔行扫描标志(0x40)，0x80 表示带局部调色板
+        self.file.write(b'\x2c' + struct.pack('<HHHHB', left, top, width, height, 0x80 | (local & 0x40) | palette_bits))
+        self.file.write(palette)
+        self.file.write(data[pos:image_data_end])
+        self.frames += 1
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.write(b'\x3b')  # 文件结束符
+        self.file.close()
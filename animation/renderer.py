@@ -0,0 +1,103 @@
+"""持久化图像的增量渲染器
+
+图像只在构造时创建一次，之后每一帧只修改少数艺术家对象(artist)的数据：
+网格用一张 imshow 图像的数组，图结构用节点集合的颜色数组。
+开启 blit 时静态部分(坐标轴、边、网格线)只绘制一次并缓存为背景，
+每帧只重画变化的艺术家。
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+import networkx as nx
+
+from .sink import figure_to_rgb
+
+
+class IncrementalRenderer:
+    """持有一张图像和需要逐帧更新的艺术家，render() 返回当前帧的 RGB 数组"""
+
+    def __init__(self, fig, animated, blit=True):
+        self.fig = fig
+        self.animated = animated  # 按绘制顺序排列
+        # 只有基于 Agg 的画布支持缓存背景
+        self.blit = blit and hasattr(fig.canvas, 'copy_from_bbox')
+        self._background = None
+        for artist in animated:
+            artist.set_animated(self.blit)
+
+    def render(self):
+        if not self.blit:
+            return figure_to_rgb(self.fig)
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()  # 动画艺术家不参与完整绘制，得到的就是静态背景
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+        for artist in self.animated:
+            self.fig.draw_artist(artist)
+        return np.asarray(canvas.buffer_rgba())[..., :3].copy()
+
+    def close(self):
+        plt.close(self.fig)
+
+
+class GridRenderer(IncrementalRenderer):
+    """网格渲染器：每个格子的状态存在一个整数数组里，用一张 imshow 显示
+
+    状态编号对应 colors 中的颜色，默认 0 可通行、1 障碍、2 已访问、3 路径。
+    """
+
+    FREE, OBSTACLE, VISITED, PATH = 0, 1, 2, 3
+    # 与原先在白底上叠加半透明矩形的效果一致
+    COLORS = ['white', 'black', (0.7, 0.7, 1.0), (1.0, 0.5, 0.5)]
+
+    def __init__(self, grid, colors=None, blit=True, figsize=None):
+        grid = np.asarray(grid)
+        self.state = np.where(grid != 0, self.OBSTACLE, self.FREE).astype(np.uint8)
+        colors = colors or self.COLORS
+        cmap = mcolors.ListedColormap(colors)
+        norm = mcolors.BoundaryNorm(np.arange(len(colors) + 1) - 0.5, cmap.N)
+
+        fig, ax = plt.subplots(figsize=figsize)
+        self.image = ax.imshow(self.state, cmap=cmap, norm=norm, interpolation='nearest')
+        ax.set_xticks([])
+        ax.set_yticks([])
+        # 边框画在图像之上，blit 时也要跟着重画
+        super().__init__(fig, [self.image, *ax.spines.values()], blit)
+
+    def set_cells(self, cells, state):
+        """把一批 (行, 列) 格子设为指定状态"""
+        for i, j in cells:
+            self.state[i, j] = state
+        self.image.set_data(self.state)
+
+
+class GraphRenderer(IncrementalRenderer):
+    """图渲染器：边只画一次，节点颜色保存在数组里逐帧修改"""
+
+    def __init__(self, G, pos, node_color, edge_color='gray', node_size=300, labels=None,
+                 font_size=8, blit=True, figsize=None):
+        fig, ax = plt.subplots(figsize=figsize)
+        ax.axis('off')
+        self.nodes = list(G.nodes())
+        self.index = {node: k for k, node in enumerate(self.nodes)}
+        nx.draw_networkx_edges(G, pos, ax=ax, edge_color=edge_color, width=1.5)
+        self.collection = nx.draw_networkx_nodes(G, pos, nodelist=self.nodes, ax=ax,
+                                                 node_color=node_color, node_size=node_size)
+        self.facecolors = mcolors.to_rgba_array(self.collection.get_facecolor())
+        if len(self.facecolors) == 1:
+            self.facecolors = np.repeat(self.facecolors, len(self.nodes), axis=0)
+        animated = [self.collection]
+        if labels is not None:
+            # 标签在节点之上，必须和节点一起逐帧重画
+            texts = nx.draw_networkx_labels(G, pos, labels, ax=ax, font_size=font_size)
+            animated.extend(texts.values())
+        super().__init__(fig, animated, blit)
+
+    def set_nodes(self, nodes, color):
+        """把一批节点设为指定颜色"""
+        rgba = mcolors.to_rgba(color)
+        for node in nodes:
+            self.facecolors[self.index[node]] = rgba
+        self.collection.set_facecolor(self.facecolors)
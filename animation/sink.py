@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .gif import GifStreamWriter
+
+
+def figure_to_rgb(fig):
+    """把 matplotlib 图像渲染为 (高, 宽, 3) 的 RGB 数组，不经过磁盘"""
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
+
+
+class FrameSink:
+    """帧接收器：逐帧接收图像并立即编码写出，内存中只保留当前帧
+
+    按文件扩展名选择编码器：.gif 使用 GifStreamWriter，
+    .mp4 等视频格式使用 imageio 的 ffmpeg 写入器(需要安装 imageio-ffmpeg)。
+    duration 为每帧时长(秒)，也可以用 fps 指定。
+    """
+
+    def __init__(self, path, duration=0.2, fps=None):
+        if fps is not None:
+            duration = 1 / fps
+        self.path = path
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.gif':
+            self.writer = GifStreamWriter(path, duration=duration)
+            self._append = self.writer.append
+        else:
+            import imageio
+            self.writer = imageio.get_writer(path, fps=1 / duration, macro_block_size=1)
+            self._append = self.writer.append_data
+        self.frames = 0
+
+    def add_frame(self, rgb):
+        """写入一帧 RGB 数组"""
+        self._append(rgb)
+        self.frames += 1
+
+    def add_figure(self, fig, close=True):
+        """渲染并写入一帧 matplotlib 图像，默认随后关闭该图像"""
+        self.add_frame(figure_to_rgb(fig))
+        if close:
+            plt.close(fig)
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
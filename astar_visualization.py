@@ -3,6 +3,9 @@ import math
 import heapq
 from collections import deque
 
+from search_engine import astar as astar_search
+from search_engine.heuristics import manhattan, octile
+
 # 初始化pygame
 pygame.init()
 
@@ -87,7 +90,7 @@ class Node:
     def draw(self, win):
         pygame.draw.rect(win, self.color, (self.x, self.y, GRID_SIZE, GRID_SIZE))
 
-    def update_neighbors(self, grid):
+    def update_neighbors(self, grid, connectivity=4):
         self.neighbors = []
         # 下
         if self.row < ROWS - 1 and not grid[self.row + 1][self.col].is_barrier():
@@ -101,11 +104,20 @@ class Node:
         # 左
         if self.col > 0 and not grid[self.row][self.col - 1].is_barrier():
             self.neighbors.append(grid[self.row][self.col - 1])
-
-def h(p1, p2):
+        if connectivity == 8:
+            # 斜向：两侧的正交格子都可通行时才能斜走，不擦过障碍的角
+            for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+                r, c = self.row + dr, self.col + dc
+                if 0 <= r < ROWS and 0 <= c < COLS and not grid[r][c].is_barrier() \
+                        and not grid[self.row][c].is_barrier() and not grid[r][self.col].is_barrier():
+                    self.neighbors.append(grid[r][c])
+
+def h(p1, p2, connectivity=4):
     x1, y1 = p1
     x2, y2 = p2
-    return abs(x1 - x2) + abs(y1 - y2)
+    # 四连通用曼哈顿距离，八连通用八方向(octile)距离
+    heuristic = manhattan if connectivity == 4 else octile
+    return heuristic(abs(x1 - x2), abs(y1 - y2))
 
 def reconstruct_path(current, draw):
     while current.parent:
@@ -113,7 +125,7 @@ def reconstruct_path(current, draw):
         current.make_path()
         draw()
 
-def algorithm(draw, grid, start, end):
+def algorithm(draw, grid, start, end, connectivity=4):
     count = 0
     open_set = []
     heapq.heappush(open_set, (0, count, start))
@@ -121,7 +133,7 @@ def algorithm(draw, grid, start, end):
     g_score = {node: float('inf') for row in grid for node in row}
     g_score[start] = 0
     f_score = {node: float('inf') for row in grid for node in row}
-    f_score[start] = h(start.get_pos(), end.get_pos())
+    f_score[start] = h(start.get_pos(), end.get_pos(), connectivity)
 
     open_set_hash = {start}
 
@@ -140,12 +152,13 @@ def algorithm(draw, grid, start, end):
             return True
 
         for neighbor in current.neighbors:
-            temp_g_score = g_score[current] + 1
+            # 直走代价 1，斜走代价 √2
+            temp_g_score = g_score[current] + math.dist(current.get_pos(), neighbor.get_pos())
 
             if temp_g_score < g_score[neighbor]:
                 came_from[neighbor] = current
                 g_score[neighbor] = temp_g_score
-                f_score[neighbor] = temp_g_score + h(neighbor.get_pos(), end.get_pos())
+                f_score[neighbor] = temp_g_score + h(neighbor.get_pos(), end.get_pos(), connectivity)
                 if neighbor not in open_set_hash:
                     count += 1
                     heapq.heappush(open_set, (f_score[neighbor], count, neighbor))
@@ -159,6 +172,18 @@ def algorithm(draw, grid, start, end):
 
     return False
 
+def jps_algorithm(draw, grid, start, end, connectivity=4):
+    """用无界面的跳点搜索(JPS)求最短路径，只绘制最终结果；JPS 只支持四连通，八连通时退回普通 A*"""
+    occupancy = [[1 if node.is_barrier() else 0 for node in row] for row in grid]
+    mode = 'jps' if connectivity == 4 else 'plain'
+    result = astar_search(occupancy, start.get_pos(), end.get_pos(), mode=mode, connectivity=connectivity)
+    if result.path is None:
+        return False
+    for row, col in result.path[1:-1]:
+        grid[row][col].make_path()
+    draw()
+    return True
+
 def make_grid():
     grid = []
     for i in range(ROWS):
@@ -194,6 +219,7 @@ def main():
     grid = make_grid()
     start = None
     end = None
+    connectivity = 4  # 按D键在四连通和八连通之间切换
     run = True
 
     while run:
@@ -229,9 +255,16 @@ def main():
                 if event.key == pygame.K_SPACE and start and end:
                     for row in grid:
                         for node in row:
-                            node.update_neighbors(grid)
+                            node.update_neighbors(grid, connectivity)
+
+                    algorithm(lambda: draw(WINDOW, grid), grid, start, end, connectivity)
+
+                if event.key == pygame.K_j and start and end:
+                    jps_algorithm(lambda: draw(WINDOW, grid), grid, start, end, connectivity)
 
-                    algorithm(lambda: draw(WINDOW, grid), grid, start, end)
+                if event.key == pygame.K_d:
+                    connectivity = 8 if connectivity == 4 else 4
+                    pygame.display.set_caption(f"A*搜索算法可视化（{connectivity}连通）")
 
                 if event.key == pygame.K_c:
                     start = None
@@ -0,0 +1,21 @@
+"""无界面的博弈树搜索核心
+
+局面实现 Game 接口(legal_moves/play/undo/is_terminal/evaluate)，
+搜索函数直接在局面上走子和悔棋，不做任何绘图。
+"""
+from .game import WIN, Game, SearchInfo
+from .tictactoe import TicTacToe
+from .connect4 import ConnectFour
+from .tree import TreeGame
+from .search import minimax, alphabeta
+from .negamax import negamax, pvs, mtdf
+from .parallel import root_parallel
+from .table import TranspositionTable
+from .deepening import Searcher, iterative_deepening
+
+__all__ = [
+    'WIN', 'Game', 'SearchInfo',
+    'TicTacToe', 'ConnectFour', 'TreeGame',
+    'minimax', 'alphabeta', 'negamax', 'pvs', 'mtdf', 'root_parallel',
+    'TranspositionTable', 'Searcher', 'iterative_deepening',
+]
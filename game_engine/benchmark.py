@@ -0,0 +1,57 @@
+"""搜索速度基准：python -m game_engine.benchmark"""
+import time
+
+from .connect4 import ConnectFour
+from .deepening import iterative_deepening
+from .negamax import mtdf, negamax, pvs
+from .parallel import root_parallel
+from .search import alphabeta, minimax
+from .table import TranspositionTable
+from .tictactoe import TicTacToe
+
+METHODS = {
+    'minimax': minimax,
+    'alphabeta': alphabeta,
+    'negamax': negamax,
+    'pvs': pvs,
+    'mtdf': mtdf,
+    'deepening': lambda game, depth, tt=None: iterative_deepening(game, depth, tt=tt),
+    # 每个工作进程自带置换表
+    'parallel': lambda game, depth, tt=None: root_parallel(game, depth),
+}
+
+
+def benchmark(game, depth, method='alphabeta', tt=None):
+    """在 game 上跑一次指定深度的搜索，返回 (SearchInfo, 秒数, 每秒节点数)"""
+    if method not in METHODS:
+        raise ValueError(f"未知的搜索方法: {method}")
+    start = time.perf_counter()
+    info = METHODS[method](game, depth, tt=tt)
+    seconds = time.perf_counter() - start
+    return info, seconds, info.nodes / seconds if seconds else float('inf')
+
+
+def main():
+    cases = [
+        ('井字棋', TicTacToe, 9, 'minimax'),
+        ('井字棋', TicTacToe, 9, 'alphabeta'),
+        ('四子棋', ConnectFour, 5, 'minimax'),
+        ('四子棋', ConnectFour, 9, 'alphabeta'),
+        ('四子棋', ConnectFour, 9, 'negamax'),
+        ('四子棋', ConnectFour, 9, 'pvs'),
+        ('四子棋', ConnectFour, 9, 'mtdf'),
+        ('四子棋', ConnectFour, 9, 'deepening'),
+        ('四子棋', ConnectFour, 9, 'parallel'),
+    ]
+    for name, factory, depth, method in cases:
+        # MTD(f) 离不开置换表，不用置换表时它会自己建一张；并行搜索不使用传入的置换表
+        tables = {'mtdf': (TranspositionTable(),), 'parallel': (None,)}.get(method, (None, TranspositionTable()))
+        for tt in tables:
+            info, seconds, nps = benchmark(factory(), depth, method, tt)
+            label = method + ('+tt' if tt is not None else '')
+            print(f"{name} {label:<13} 深度 {depth}: 着法 {info.move} 分值 {info.value:g} "
+                  f"节点 {info.nodes} 用时 {seconds:.2f}s 速度 {nps:,.0f} 节点/秒")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+from .game import WIN, Game
+from .zobrist import zobrist_keys
+
+WIDTH, HEIGHT = 7, 6
+_STRIDE = HEIGHT + 1  # 每列多留一位作哨兵，移位判胜时不会跨列误连
+# 中间的列参与的连线最多，先试中间列
+_CENTER_FIRST = sorted(range(WIDTH), key=lambda c: abs(c - WIDTH // 2))
+
+
+def _windows():
+    """全部 69 个连续四格窗口的位掩码"""
+    windows = []
+    for c in range(WIDTH):
+        for r in range(HEIGHT):
+            for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                cells = [(c + k * dc, r + k * dr) for k in range(4)]
+                if all(0 <= cc < WIDTH and 0 <= rr < HEIGHT for cc, rr in cells):
+                    windows.append(sum(1 << (cc * _STRIDE + rr) for cc, rr in cells))
+    return windows
+
+
+_WINDOWS = _windows()
+# 窗口中只有一方的 k 个棋子时的得分
+_WEIGHTS = (0, 1, 4, 32, 0)
+_ZOBRIST = zobrist_keys(2, WIDTH * _STRIDE)
+
+
+def _has_four(board):
+    """位棋盘中是否有四子相连：竖、横、两条斜线各对应一个移位量"""
+    for shift in (1, _STRIDE, _STRIDE - 1, _STRIDE + 1):
+        pairs = board & (board >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+class ConnectFour(Game):
+    """四子棋(7 列 6 行)：双方各一个位棋盘，第 c 列第 r 行对应第 c*7+r 位"""
+
+    def __init__(self):
+        self.boards = [0, 0]  # [先手, 后手]
+        self.heights = [0] * WIDTH
+        self.history = []
+        self.hash = 0
+
+    @property
+    def turn(self):
+        return 1 if len(self.history) % 2 == 0 else -1
+
+    def _winner(self):
+        """只有刚走完一步的一方可能刚连成四子"""
+        if not self.history:
+            return 0
+        side = (len(self.history) - 1) % 2
+        if _has_four(self.boards[side]):
+            return 1 if side == 0 else -1
+        return 0
+
+    def legal_moves(self):
+        if self._winner():
+            return []
+        return [c for c in _CENTER_FIRST if self.heights[c] < HEIGHT]
+
+    def play(self, move):
+        side = len(self.history) % 2
+        cell = move * _STRIDE + self.heights[move]
+        self.boards[side] |= 1 << cell
+        self.hash ^= _ZOBRIST[side][cell]
+        self.heights[move] += 1
+        self.history.append(move)
+
+    def undo(self):
+        move = self.history.pop()
+        side = len(self.history) % 2
+        self.heights[move] -= 1
+        cell = move * _STRIDE + self.heights[move]
+        self.boards[side] ^= 1 << cell
+        self.hash ^= _ZOBRIST[side][cell]
+
+    def is_terminal(self):
+        return len(self.history) == WIDTH * HEIGHT or bool(self._winner())
+
+    def evaluate(self):
+        winner = self._winner()
+        if winner:
+            return winner * (WIN - len(self.history))
+        # 非终局：统计只含一方棋子的窗口，子越多分越高
+        first, second = self.boards
+        score = 0
+        for window in _WINDOWS:
+            a = first & window
+            b = second & window
+            if not b:
+                score += _WEIGHTS[a.bit_count()]
+            elif not a:
+                score -= _WEIGHTS[b.bit_count()]
+        return score
+
+    def copy(self):
+        game = ConnectFour()
+        game.boards = list(self.boards)
+        game.heights = list(self.heights)
+        game.history = list(self.history)
+        game.hash = self.hash
+        return game
+
+    def key(self):
+        return self.hash
+
+    def __str__(self):
+        rows = []
+        for r in reversed(range(HEIGHT)):
+            row = ''
+            for c in range(WIDTH):
+                bit = 1 << (c * _STRIDE + r)
+                row += 'X' if self.boards[0] & bit else 'O' if self.boards[1] & bit else '.'
+            rows.append(row)
+        return '\n'.join(rows)
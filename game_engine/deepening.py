@@ -0,0 +1,205 @@
+"""迭代加深的 α-β 搜索
+
+深度从 1 开始逐层加深，直到达到最大深度或用完时间预算；
+超时时放弃未完成的一层，返回上一层完整搜索的结果，保证按时给出着法。
+浅层搜索留在置换表里的最好着法、杀手着法和历史分数让下一层的着法排序越来越好，
+α-β 因此接近 O(b^(d/2)) 的最好情况，多搜的浅层几乎不增加总节点数。
+"""
+import time
+
+from .game import WIN, SearchInfo
+from .table import EXACT, LOWER, UPPER, TranspositionTable
+
+INF = float('inf')
+# 分值绝对值超过它即视为已算出胜负，不再用期望窗口
+_MATE = WIN - 1000
+# 每搜索这么多个节点检查一次时间
+_CHECK_EVERY = 1024
+
+
+class _Timeout(Exception):
+    """时间预算用完，中止当前这一层"""
+
+
+class Searcher:
+    """带时间预算的迭代加深 α-β 搜索器
+
+    着法排序依次为：置换表中的最好着法(上一层的主要变例)、本层的两个杀手着法、
+    按历史分数从高到低的其余着法。aspiration 为期望窗口的半宽，
+    每层先在上一层分值附近的小窗口内搜索，落到窗口外再用全窗口重搜；为 0 时不用期望窗口。
+    同一个 Searcher 可以反复搜索，置换表和历史分数在多次搜索之间保留。
+    """
+
+    def __init__(self, tt=None, aspiration=50, killers=True, history=True):
+        self.tt = TranspositionTable() if tt is None else tt
+        self.aspiration = aspiration
+        self.use_killers = killers
+        self.use_history = history
+        self.history = {}
+        self.killers = []
+
+    def search(self, game, max_depth=64, time_limit=None):
+        """在 game 上迭代加深搜索，返回最后一层完整搜索的 SearchInfo
+
+        time_limit 为秒数，None 表示只受 max_depth 限制。
+        nodes 为各层累计的节点数，stats 中有主要变例 pv、期望窗口重搜次数 research 和耗时 time。
+        """
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.nodes = 0
+        self.made = 0  # 已走出但尚未悔棋的步数，超时中止时据此把局面恢复原样
+        self.killers = [[None, None] for _ in range(max_depth + 1)]
+        # 历史分数逐次搜索减半，旧信息逐渐淡出
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+        self.tt.new_search()
+
+        info = SearchInfo(stats={'research': 0, 'pv': []})
+        moves = game.legal_moves()
+        if not moves:
+            info.value = game.evaluate()
+            return info
+        start = time.perf_counter()
+        for depth in range(1, max_depth + 1):
+            try:
+                value, move = self._aspiration_search(game, depth, info)
+            except _Timeout:
+                while self.made:
+                    game.undo()
+                    self.made -= 1
+                break
+            info.value, info.move, info.depth = value, move, depth
+            info.stats['pv'] = self.principal_variation(game, depth)
+            if abs(value) >= _MATE:
+                break  # 已算出胜负，更深的搜索不会改变结果
+        if info.move is None:
+            info.move = moves[0]  # 连第一层都没搜完，至少给出一个合法着法
+        info.nodes = self.nodes
+        info.stats['time'] = time.perf_counter() - start
+        return info
+
+    def _aspiration_search(self, game, depth, info):
+        if info.move is None or not self.aspiration or abs(info.value) >= _MATE:
+            return self._root(game, depth, -INF, INF)
+        alpha, beta = info.value - self.aspiration, info.value + self.aspiration
+        value, move = self._root(game, depth, alpha, beta)
+        if value <= alpha or value >= beta:
+            # 真实分值在窗口之外，上面的结果只是一个界，用全窗口重搜
+            info.stats['research'] += 1
+            value, move = self._root(game, depth, -INF, INF)
+        return value, move
+
+    def _root(self, game, depth, alpha, beta):
+        entry = self.tt.probe(game.key())
+        moves = self._order(game.legal_moves(), entry[3] if entry else None, 0)
+        maximizing = game.turn == 1
+        best_value, best_move = (-INF if maximizing else INF), None
+        orig_alpha, orig_beta = alpha, beta
+        for move in moves:
+            self._play(game, move)
+            value = self._alphabeta(game, depth - 1, 1, alpha, beta)
+            self._undo(game)
+            if best_move is None or (value > best_value if maximizing else value < best_value):
+                best_value, best_move = value, move
+            if maximizing:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        flag = UPPER if best_value <= orig_alpha else LOWER if best_value >= orig_beta else EXACT
+        self.tt.store(game.key(), depth, flag, best_value, best_move)
+        return best_value, best_move
+
+    def _play(self, game, move):
+        game.play(move)
+        self.made += 1
+
+    def _undo(self, game):
+        game.undo()
+        self.made -= 1
+
+    def _order(self, moves, tt_move, ply):
+        """置换表着法 > 杀手着法 > 历史分数"""
+        if self.use_history and self.history:
+            history = self.history
+            moves.sort(key=lambda m: history.get(m, 0), reverse=True)
+        front = [tt_move]
+        if self.use_killers and ply < len(self.killers):
+            front += self.killers[ply]
+        for move in reversed(front):
+            if move is not None and move in moves:
+                moves.remove(move)
+                moves.insert(0, move)
+        return moves
+
+    def _record_cutoff(self, move, depth, ply):
+        """着法引起剪枝：记为本层杀手着法，并按深度的平方累加历史分数"""
+        if self.use_killers and ply < len(self.killers):
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        if self.use_history:
+            self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def _alphabeta(self, game, depth, ply, alpha, beta):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % _CHECK_EVERY == 0 and time.perf_counter() > self.deadline:
+            raise _Timeout
+        key = game.key()
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, flag, score, tt_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+        moves = game.legal_moves()
+        if depth == 0 or not moves:
+            return game.evaluate()
+
+        orig_alpha, orig_beta = alpha, beta
+        maximizing = game.turn == 1
+        value, best = (-INF if maximizing else INF), None
+        for move in self._order(moves, tt_move, ply):
+            self._play(game, move)
+            score = self._alphabeta(game, depth - 1, ply + 1, alpha, beta)
+            self._undo(game)
+            if maximizing:
+                if score > value:
+                    value, best = score, move
+                alpha = max(alpha, value)
+            else:
+                if score < value:
+                    value, best = score, move
+                beta = min(beta, value)
+            if alpha >= beta:
+                if move != tt_move:
+                    self._record_cutoff(move, depth, ply)
+                break
+        flag = UPPER if value <= orig_alpha else LOWER if value >= orig_beta else EXACT
+        self.tt.store(key, depth, flag, value, best)
+        return value
+
+    def principal_variation(self, game, depth):
+        """沿置换表中的最好着法走出主要变例，走完后把局面恢复原样"""
+        pv = []
+        while len(pv) < depth:
+            entry = self.tt.probe(game.key())
+            if entry is None or entry[3] is None or entry[3] not in game.legal_moves():
+                break
+            pv.append(entry[3])
+            game.play(entry[3])
+        for _ in pv:
+            game.undo()
+        return pv
+
+
+def iterative_deepening(game, max_depth=64, time_limit=None, tt=None, aspiration=50):
+    """一次性的迭代加深搜索；需要在多步之间保留置换表和历史分数时请直接使用 Searcher"""
+    return Searcher(tt, aspiration).search(game, max_depth, time_limit)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+
+# 终局分值：胜负的分值远大于任何启发式评估，再减去步数使搜索偏向更快的胜利、更慢的失败
+WIN = 1_000_000
+
+
+@dataclass
+class SearchInfo:
+    """一次博弈树搜索的结果：最优着法、分值与统计"""
+    value: float = 0          # 根节点的分值(先手 MAX 视角)
+    move: object = None       # 最优着法，终局或深度为 0 时为 None
+    nodes: int = 0            # 访问的节点数
+    depth: int = 0            # 搜索深度
+    stats: dict = field(default_factory=dict)  # 各算法额外的统计信息
+
+
+class Game:
+    """双人零和、轮流行棋的局面接口
+
+    局面是可变对象：play 落子、undo 悔棋，搜索时在同一个对象上来回走，不复制局面。
+    turn 为 1 表示轮到先手(MAX)，-1 表示轮到后手(MIN)；
+    evaluate 总是从先手的角度打分，终局时为 ±(WIN - 步数) 或 0。
+    """
+
+    turn = 1
+
+    def legal_moves(self):
+        """当前局面的全部合法着法，终局时为空"""
+        raise NotImplementedError
+
+    def play(self, move):
+        """走一步"""
+        raise NotImplementedError
+
+    def undo(self):
+        """撤销最近一步"""
+        raise NotImplementedError
+
+    def is_terminal(self):
+        """是否终局"""
+        raise NotImplementedError
+
+    def evaluate(self):
+        """局面分值(先手视角)"""
+        raise NotImplementedError
+
+    def copy(self):
+        """复制一份独立的局面"""
+        raise NotImplementedError
+
+    def key(self):
+        """局面的 64 位哈希(Zobrist)，用作置换表的键"""
+        raise NotImplementedError
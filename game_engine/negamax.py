@@ -0,0 +1,135 @@
+"""Negamax 形式的搜索：negamax、主要变例搜索(PVS)与 MTD(f)
+
+negamax 把分值统一成「当前走子方」的视角，子节点的分值取负即为父节点视角，
+极大层和极小层共用一份代码。分值须为整数，零宽窗口 (α, α+1) 才有意义。
+置换表中仍按先手视角存放，与 search 模块的 minimax/alphabeta 可以共用同一张表。
+"""
+from .game import SearchInfo
+from .search import _ordered
+from .table import EXACT, LOWER, UPPER, TranspositionTable
+
+INF = float('inf')
+# 换到另一方视角时上下界互换
+_FLIP = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+
+def _make_search(game, info, tt, pvs):
+    """构造 negamax 节点搜索函数 search(depth, alpha, beta, ply)，返回走子方视角的分值
+
+    pvs=True 时除第一个着法外都先用零宽窗口试探，分值落在 (α, β) 内才用全窗口重搜。
+    根节点(ply == 0)的最好着法写入 info.move。
+    """
+    stats = info.stats
+    stats.setdefault('tt_hits', 0)
+    stats.setdefault('researches', 0)
+
+    def search(depth, alpha, beta, ply=0):
+        info.nodes += 1
+        color = game.turn
+        key = tt_move = None
+        if tt is not None:
+            key = game.key()
+            entry = tt.probe(key)
+            if entry is not None:
+                entry_depth, flag, score, tt_move = entry
+                if entry_depth >= depth and ply > 0:
+                    if color == -1:
+                        flag, score = _FLIP[flag], -score
+                    if flag == EXACT:
+                        stats['tt_hits'] += 1
+                        return score
+                    if flag == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        stats['tt_hits'] += 1
+                        return score
+        moves = game.legal_moves()
+        if depth == 0 or not moves:
+            return color * game.evaluate()
+
+        orig_alpha = alpha
+        value, best = -INF, None
+        for k, move in enumerate(_ordered(moves, tt_move)):
+            game.play(move)
+            if pvs and k > 0:
+                score = -search(depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    stats['researches'] += 1
+                    score = -search(depth - 1, -beta, -alpha, ply + 1)
+            else:
+                score = -search(depth - 1, -beta, -alpha, ply + 1)
+            game.undo()
+            if score > value:
+                value, best = score, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        if ply == 0:
+            info.move = best
+        if tt is not None:
+            flag = UPPER if value <= orig_alpha else LOWER if value >= beta else EXACT
+            if color == -1:
+                flag = _FLIP[flag]
+            tt.store(key, depth, flag, color * value, best)
+        return value
+
+    return search
+
+
+def negamax(game, depth, tt=None):
+    """negamax 形式的 α-β，分值与 alphabeta 相同(先手视角)"""
+    info = SearchInfo(depth=depth)
+    if tt is not None:
+        tt.new_search()
+    info.value = game.turn * _make_search(game, info, tt, pvs=False)(depth, -INF, INF)
+    return info
+
+
+def pvs(game, depth, tt=None):
+    """主要变例搜索：假设第一个着法最好，其余着法只用零宽窗口证明它们更差
+
+    着法排序越好，需要重搜的越少，访问的节点比普通 α-β 少。
+    """
+    info = SearchInfo(depth=depth)
+    if tt is not None:
+        tt.new_search()
+    info.value = game.turn * _make_search(game, info, tt, pvs=True)(depth, -INF, INF)
+    return info
+
+
+def mtdf(game, depth, tt=None, guess=0):
+    """MTD(f)：只用零宽窗口的 α-β 反复逼近真实分值
+
+    每次零宽搜索给出一个上界或下界，上下界相遇即得到精确值；
+    置换表保存了前几次搜索的结果，重复的部分几乎不花代价，因此必须使用置换表。
+    按深度 1..depth 迭代，每层以上一层的分值作为初始猜测。
+    """
+    tt = TranspositionTable() if tt is None else tt
+    tt.new_search()
+    info = SearchInfo(depth=depth, stats={'passes': 0})
+    search = _make_search(game, info, tt, pvs=False)
+    if depth == 0 or not game.legal_moves():
+        info.nodes = 1
+        info.value = game.evaluate()
+        return info
+
+    color = game.turn
+    g = color * guess  # 走子方视角
+    for d in range(1, depth + 1):
+        lower, upper = -INF, INF
+        move = None
+        while lower < upper:
+            beta = g + 1 if g == lower else g
+            g = search(d, beta - 1, beta)
+            info.stats['passes'] += 1
+            if g < beta:
+                upper = g
+            else:
+                lower = g
+                move = info.move  # 只有 fail high 的那一次给出的着法分值不低于 g
+        info.move = move
+    info.value = color * g
+    return info
+
@@ -0,0 +1,78 @@
+"""多进程的根节点并行 α-β
+
+根节点的每个着法是一棵独立的子树，分发给进程池分别搜索。
+各进程通过一个共享的下界(根节点走子方视角)交换已经证明的最好分值：
+任务开始时读取当前下界作为窗口，搜到更好的精确值就更新它，后面的着法因此剪得更多。
+每个进程有自己的置换表，在它搜索的各个着法之间复用。
+"""
+import os
+from multiprocessing import Pool, Value
+
+from .game import SearchInfo
+from .negamax import _make_search
+from .table import TranspositionTable
+
+INF = float('inf')
+# 工作进程中的搜索状态，由 _init_worker 设置
+_worker = {}
+
+
+def _init_worker(game, depth, bound, tt_size):
+    _worker.update(game=game, depth=depth, bound=bound, tt=TranspositionTable(tt_size))
+
+
+def _search_move(move):
+    """在工作进程中搜索根节点的一个着法，返回 (分值, 是否精确, 节点数)
+
+    窗口取 (当前下界 - 1, +∞)：分值整数，凡是不比已知最好分值差的着法都能得到精确值，
+    只有严格更差的着法才只得到一个上界。
+    """
+    game, bound = _worker['game'], _worker['bound']
+    alpha = bound.value - 1
+    info = SearchInfo()
+    search = _make_search(game, info, _worker['tt'], pvs=True)
+    game.play(move)
+    value = -search(_worker['depth'] - 1, -INF, -alpha, ply=1)
+    game.undo()
+    exact = value > alpha
+    if exact:
+        with bound.get_lock():
+            if value > bound.value:
+                bound.value = value
+    return value, exact, info.nodes
+
+
+def root_parallel(game, depth, processes=None, tt_size=1 << 18):
+    """根节点并行的 α-β 搜索，分值与 alphabeta 相同(先手视角)
+
+    第一个着法先在本进程中搜完，得到一个好的下界，其余着法再分给 processes 个进程。
+    分值与最优着法与进程数和完成顺序无关：分值相同的着法取 legal_moves 中靠前的一个，
+    与串行搜索一致；节点数会随各进程读到下界的时机略有不同。
+    tt_size 为每个进程置换表的槽位数。
+    """
+    info = SearchInfo(depth=depth)
+    moves = game.legal_moves()
+    if depth == 0 or not moves:
+        info.nodes = 1
+        info.value = game.evaluate()
+        return info
+
+    bound = Value('d', -INF)
+    try:
+        _init_worker(game, depth, bound, tt_size)
+        results = [_search_move(moves[0])]
+    finally:
+        _worker.clear()
+    if len(moves) > 1:
+        with Pool(processes or os.cpu_count(), _init_worker, (game, depth, bound, tt_size)) as pool:
+            results += pool.map(_search_move, moves[1:], chunksize=1)
+
+    best_value = -INF
+    for move, (value, exact, nodes) in zip(moves, results):
+        info.nodes += nodes
+        if exact and value > best_value:
+            best_value, info.move = value, move
+    info.nodes += 1
+    info.value = game.turn * best_value
+    info.stats['processes'] = processes or os.cpu_count()
+    return info
@@ -0,0 +1,159 @@
+"""与可视化无关的博弈树搜索
+
+搜索直接在局面对象上 play/undo，不复制局面、不绘图，只返回分值、最优着法和节点数。
+传入 tt(TranspositionTable)时，经不同着法顺序到达的同一局面只搜索一次。
+"""
+from .game import SearchInfo
+from .table import EXACT, LOWER, UPPER
+
+INF = float('inf')
+
+
+def _ordered(moves, first):
+    """把置换表记下的最好着法提到最前"""
+    if first is not None and first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+    return moves
+
+
+def minimax(game, depth, tt=None):
+    """不剪枝的极小化极大搜索，所有分值都是精确值"""
+    info = SearchInfo(depth=depth)
+    hits = 0
+
+    def search(depth):
+        nonlocal hits
+        info.nodes += 1
+        if tt is not None:
+            entry = tt.probe(game.key())
+            if entry is not None and entry[0] >= depth and entry[1] == EXACT:
+                hits += 1
+                return entry[2]
+        moves = game.legal_moves()
+        if depth == 0 or not moves:
+            value = game.evaluate()
+            if tt is not None:
+                tt.store(game.key(), depth, EXACT, value)
+            return value
+        maximizing = game.turn == 1
+        value, best = (-INF if maximizing else INF), None
+        for move in moves:
+            game.play(move)
+            score = search(depth - 1)
+            game.undo()
+            if best is None or (score > value if maximizing else score < value):
+                value, best = score, move
+        if tt is not None:
+            tt.store(game.key(), depth, EXACT, value, best)
+        return value
+
+    if tt is not None:
+        tt.new_search()
+    info.value, info.move = _root(game, depth, lambda: search(depth - 1), info)
+    if tt is not None:
+        info.stats['tt_hits'] = hits
+    return info
+
+
+def alphabeta(game, depth, alpha=-INF, beta=INF, tt=None):
+    """α-β 剪枝的极小化极大搜索，分值与 minimax 相同
+
+    使用置换表时，命中的条目按界类型收紧窗口，条目记下的最好着法最先搜索。
+    """
+    info = SearchInfo(depth=depth)
+    hits = 0
+
+    def search(depth, alpha, beta):
+        nonlocal hits
+        info.nodes += 1
+        key = best_first = None
+        if tt is not None:
+            key = game.key()
+            entry = tt.probe(key)
+            if entry is not None:
+                entry_depth, flag, score, best_first = entry
+                if entry_depth >= depth:
+                    if flag == EXACT:
+                        hits += 1
+                        return score
+                    if flag == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        hits += 1
+                        return score
+        moves = game.legal_moves()
+        if depth == 0 or not moves:
+            value = game.evaluate()
+            if tt is not None:
+                tt.store(key, depth, EXACT, value)
+            return value
+        orig_alpha, orig_beta = alpha, beta
+        best = None
+        if game.turn == 1:
+            value = -INF
+            for move in _ordered(moves, best_first):
+                game.play(move)
+                score = search(depth - 1, alpha, beta)
+                game.undo()
+                if score > value:
+                    value, best = score, move
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break  # β剪枝
+        else:
+            value = INF
+            for move in _ordered(moves, best_first):
+                game.play(move)
+                score = search(depth - 1, alpha, beta)
+                game.undo()
+                if score < value:
+                    value, best = score, move
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break  # α剪枝
+        if tt is not None:
+            # 分值落在原窗口之外时只是一个界
+            flag = UPPER if value <= orig_alpha else LOWER if value >= orig_beta else EXACT
+            tt.store(key, depth, flag, value, best)
+        return value
+
+    # 根节点逐个着法搜索，窗口随已找到的最好分值收紧
+    bounds = [alpha, beta]
+
+    def child():
+        return search(depth - 1, *bounds)
+
+    if tt is not None:
+        tt.new_search()
+    info.value, info.move = _root(game, depth, child, info, bounds)
+    if tt is not None:
+        info.stats['tt_hits'] = hits
+    return info
+
+
+def _root(game, depth, search_child, info, bounds=None):
+    """根节点：逐个着法调用 search_child，返回 (分值, 最优着法)
+
+    bounds 为 [alpha, beta] 列表时随根节点的最好分值一起收紧。
+    """
+    info.nodes += 1
+    moves = game.legal_moves()
+    if depth == 0 or not moves:
+        return game.evaluate(), None
+    maximizing = game.turn == 1
+    best_value, best_move = (-INF if maximizing else INF), None
+    for move in moves:
+        game.play(move)
+        value = search_child()
+        game.undo()
+        if best_move is None or (value > best_value if maximizing else value < best_value):
+            best_value, best_move = value, move
+            if bounds is not None:
+                if maximizing:
+                    bounds[0] = max(bounds[0], value)
+                else:
+                    bounds[1] = min(bounds[1], value)
+    return best_value, best_move
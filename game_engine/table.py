@@ -0,0 +1,62 @@
+import numpy as np
+
+# 置换表条目的界类型：分值精确、只是下界(fail high)、只是上界(fail low)
+EXACT, LOWER, UPPER = 0, 1, 2
+NO_MOVE = -1
+
+
+class TranspositionTable:
+    """定长、数组存储的置换表，以 Zobrist 哈希为键
+
+    每个槽位存 键、分值、剩余深度、界类型、最好着法和写入时的搜索代数，
+    各字段分别是一个 NumPy 数组，槽位数取 2 的幂，用哈希的低位直接定位。
+    着法须是非负小整数(格子或列号)。
+
+    替换策略：空槽、同一局面、新条目深度不低于旧条目，或旧条目来自更早的搜索时覆盖，
+    否则保留更深的旧条目。
+    """
+
+    def __init__(self, size=1 << 20):
+        size = 1 << max(0, int(size) - 1).bit_length()
+        self.size = size
+        self.mask = size - 1
+        self.keys = np.zeros(size, dtype=np.uint64)
+        self.values = np.zeros(size, dtype=np.float64)
+        self.depths = np.full(size, -1, dtype=np.int16)  # -1 表示空槽
+        self.flags = np.zeros(size, dtype=np.int8)
+        self.moves = np.full(size, NO_MOVE, dtype=np.int16)
+        self.ages = np.zeros(size, dtype=np.uint8)
+        self.generation = 0
+
+    def new_search(self):
+        """开始新一次搜索，旧条目此后可以被任意覆盖"""
+        self.generation = (self.generation + 1) % 256
+
+    def clear(self):
+        self.depths[:] = -1
+        self.moves[:] = NO_MOVE
+
+    def probe(self, key):
+        """返回 (剩余深度, 界类型, 分值, 最好着法)，未命中时返回 None"""
+        i = key & self.mask
+        if self.depths[i] < 0 or int(self.keys[i]) != key:
+            return None
+        move = int(self.moves[i])
+        return int(self.depths[i]), int(self.flags[i]), float(self.values[i]), None if move == NO_MOVE else move
+
+    def store(self, key, depth, flag, value, move=None):
+        i = key & self.mask
+        old_depth = self.depths[i]
+        if (old_depth >= 0 and int(self.keys[i]) != key and depth < old_depth
+                and self.ages[i] == self.generation):
+            return
+        self.keys[i] = key
+        self.values[i] = value
+        self.depths[i] = depth
+        self.flags[i] = flag
+        self.moves[i] = NO_MOVE if move is None else move
+        self.ages[i] = self.generation
+
+    def __len__(self):
+        """已占用的槽位数"""
+        return int(np.count_nonzero(self.depths >= 0))
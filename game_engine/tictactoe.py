@@ -0,0 +1,77 @@
+from .game import WIN, Game
+from .zobrist import zobrist_keys
+
+# 八条连线，棋盘格子按行编号 0..8
+_LINES = (0b000000111, 0b000111000, 0b111000000,
+          0b001001001, 0b010010010, 0b100100100,
+          0b100010001, 0b001010100)
+_FULL = 0b111111111
+_ZOBRIST = zobrist_keys(2, 9)
+
+
+class TicTacToe(Game):
+    """井字棋：双方的棋子各用一个 9 位整数表示，判胜只需 8 次按位与"""
+
+    def __init__(self):
+        self.boards = [0, 0]  # [先手 X, 后手 O]
+        self.history = []
+        self.hash = 0
+
+    @property
+    def turn(self):
+        return 1 if len(self.history) % 2 == 0 else -1
+
+    def _winner(self):
+        """刚走完一步的一方是否连成一线，返回 1/-1，否则 0"""
+        if not self.history:
+            return 0
+        side = (len(self.history) - 1) % 2
+        board = self.boards[side]
+        for line in _LINES:
+            if board & line == line:
+                return 1 if side == 0 else -1
+        return 0
+
+    def legal_moves(self):
+        if self._winner():
+            return []
+        occupied = self.boards[0] | self.boards[1]
+        return [i for i in range(9) if not occupied >> i & 1]
+
+    def play(self, move):
+        side = len(self.history) % 2
+        self.boards[side] |= 1 << move
+        self.hash ^= _ZOBRIST[side][move]
+        self.history.append(move)
+
+    def undo(self):
+        move = self.history.pop()
+        side = len(self.history) % 2
+        self.boards[side] ^= 1 << move
+        self.hash ^= _ZOBRIST[side][move]
+
+    def is_terminal(self):
+        return bool(self._winner()) or (self.boards[0] | self.boards[1]) == _FULL
+
+    def evaluate(self):
+        winner = self._winner()
+        if winner:
+            return winner * (WIN - len(self.history))
+        # 非终局：只有一方棋子的连线数之差
+        x, o = self.boards
+        return sum((not line & o) - (not line & x) for line in _LINES)
+
+    def copy(self):
+        game = TicTacToe()
+        game.boards = list(self.boards)
+        game.history = list(self.history)
+        game.hash = self.hash
+        return game
+
+    def key(self):
+        return self.hash
+
+    def __str__(self):
+        x, o = self.boards
+        cells = ['X' if x >> i & 1 else 'O' if o >> i & 1 else '.' for i in range(9)]
+        return '\n'.join(''.join(cells[r * 3:r * 3 + 3]) for r in range(3))
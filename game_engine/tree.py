@@ -0,0 +1,43 @@
+from .game import Game
+
+
+class TreeGame(Game):
+    """把静态博弈树包装成局面接口，节点需有 value 与 children 属性
+
+    着法是子节点的下标，叶子节点的 value 即其分值(先手视角)。
+    """
+
+    def __init__(self, root):
+        self.path = [root]
+
+    @property
+    def turn(self):
+        return 1 if len(self.path) % 2 == 1 else -1
+
+    @property
+    def node(self):
+        return self.path[-1]
+
+    def legal_moves(self):
+        return list(range(len(self.node.children)))
+
+    def play(self, move):
+        self.path.append(self.node.children[move])
+
+    def undo(self):
+        self.path.pop()
+
+    def is_terminal(self):
+        return not self.node.children
+
+    def evaluate(self):
+        return self.node.value
+
+    def copy(self):
+        game = TreeGame(self.path[0])
+        game.path = list(self.path)
+        return game
+
+    def key(self):
+        # 树中没有置换，每个节点对象本身就是唯一的局面
+        return id(self.node) & 0xFFFFFFFFFFFFFFFF
@@ -0,0 +1,17 @@
+import random
+
+
+def zobrist_keys(*shape, seed=0x5EED):
+    """生成 Zobrist 随机键：嵌套列表，最内层是 64 位随机整数
+
+    每个(棋子, 格子)对应一个随机数，局面的哈希是所有在盘棋子键的异或，
+    走子、悔棋时各异或一次即可增量更新。固定种子保证不同进程得到相同的键。
+    """
+    rng = random.Random(seed)
+
+    def build(dims):
+        if len(dims) == 1:
+            return [rng.getrandbits(64) for _ in range(dims[0])]
+        return [build(dims[1:]) for _ in range(dims[0])]
+
+    return build(shape)
@@ -0,0 +1,20 @@
+"""无界面的搜索核心
+
+算法本身不做任何绘图，只返回路径、代价和扩展统计；
+需要可视化时，把一个观察者(observer)传给搜索函数即可。
+"""
+from .result import SearchResult, SearchObserver
+from .csr import CSRGraph, as_csr
+from .graph_search import bfs, dfs, ucs
+from .grid_search import GridMap, as_grid_map, astar, greedy
+from .batch import batch_search, distance_matrix
+from .trace import SearchTrace
+
+__all__ = [
+    'SearchResult', 'SearchObserver',
+    'CSRGraph', 'as_csr',
+    'bfs', 'dfs', 'ucs',
+    'GridMap', 'as_grid_map', 'astar', 'greedy',
+    'batch_search', 'distance_matrix',
+    'SearchTrace',
+]
@@ -0,0 +1,126 @@
+"""批量多对多查询
+
+同一起点的所有查询共用一棵最短路径树：先按起点分组，
+每个起点只跑一次 BFS/Dijkstra，直到该组的全部终点都已确定为止。
+"""
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .csr import as_csr
+from .graph_search import _trace_parents
+from .result import SearchResult
+
+
+def _bfs_tree(graph, source, targets):
+    """从 source 出发的 BFS 树，targets 中的节点全部被发现后提前结束"""
+    offsets, targets_arr = graph.offsets, graph.targets
+    parent = [-1] * graph.num_nodes
+    dist = [-1] * graph.num_nodes
+    dist[source] = 0
+    remaining = set(targets)
+    remaining.discard(source)
+    queue = deque([source])
+    expanded = 0
+
+    while queue and remaining:
+        node = queue.popleft()
+        expanded += 1
+        for neighbor in targets_arr[offsets[node]:offsets[node + 1]].tolist():
+            if dist[neighbor] == -1:
+                dist[neighbor] = dist[node] + 1
+                parent[neighbor] = node
+                remaining.discard(neighbor)
+                queue.append(neighbor)
+
+    inf = float('inf')
+    return [inf if d == -1 else d for d in dist], parent, expanded
+
+
+def _dijkstra_tree(graph, source, targets):
+    """从 source 出发的 Dijkstra 树，targets 中的节点全部出队后提前结束"""
+    offsets, targets_arr, weights = graph.offsets, graph.targets, graph.weights
+    inf = float('inf')
+    parent = [-1] * graph.num_nodes
+    dist = [inf] * graph.num_nodes
+    dist[source] = 0.0
+    remaining = set(targets)
+    open_set = [(0.0, source)]
+    expanded = 0
+
+    while open_set and remaining:
+        cost, node = heapq.heappop(open_set)
+        if cost > dist[node]:
+            continue
+        expanded += 1
+        remaining.discard(node)
+        lo, hi = offsets[node], offsets[node + 1]
+        for neighbor, weight in zip(targets_arr[lo:hi].tolist(), weights[lo:hi].tolist()):
+            new_cost = cost + weight
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                parent[neighbor] = node
+                heapq.heappush(open_set, (new_cost, neighbor))
+
+    # 提前结束时未出队节点的 dist 只是上界，但调用方只读取已确定的终点
+    return dist, parent, expanded
+
+
+_TREES = {
+    'bfs': _bfs_tree,
+    'ucs': _dijkstra_tree,
+}
+
+
+def _group_by_source(graph, pairs):
+    """{起点 id: [(查询序号, 终点 id), ...]}，保持首次出现的顺序"""
+    groups = {}
+    for k, (source, target) in enumerate(pairs):
+        groups.setdefault(graph.id_of(source), []).append((k, graph.id_of(target)))
+    return groups
+
+
+def batch_search(graph, pairs, method='ucs', return_paths=True):
+    """批量点对点查询，返回与 pairs 一一对应的 SearchResult 列表
+
+    pairs 为 [(起点, 终点), ...]；method 为 'ucs'(按边权)或 'bfs'(按边数)。
+    同一起点的查询共享一棵搜索树，result.expanded 为这棵树的扩展数，
+    result.stats['tree_size'] 为该起点分组中的查询数。
+    return_paths=False 时可达查询的 path 为空列表，只给出代价。
+    """
+    if method not in _TREES:
+        raise ValueError(f"未知的批量搜索方法: {method}")
+    graph = as_csr(graph)
+    build_tree = _TREES[method]
+    results = [None] * len(pairs)
+
+    for source, queries in _group_by_source(graph, pairs).items():
+        dist, parent, expanded = build_tree(graph, source, [t for _, t in queries])
+        for k, target in queries:
+            result = SearchResult(expanded=expanded, stats={'tree_size': len(queries)})
+            if dist[target] != float('inf'):
+                result.cost = dist[target]
+                if return_paths:
+                    result.path = [graph.name_of(u) for u in _trace_parents(parent, target)]
+                else:
+                    result.path = []
+            results[k] = result
+    return results
+
+
+def distance_matrix(graph, sources, targets, method='ucs'):
+    """起点 × 终点的距离矩阵(NumPy 数组)，不可达处为 inf
+
+    每个起点只搜索一次，得到的树同时回答所有终点。
+    """
+    if method not in _TREES:
+        raise ValueError(f"未知的批量搜索方法: {method}")
+    graph = as_csr(graph)
+    build_tree = _TREES[method]
+    target_ids = [graph.id_of(t) for t in targets]
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    for row, source in enumerate(sources):
+        dist, _, _ = build_tree(graph, graph.id_of(source), target_ids)
+        matrix[row] = [dist[t] for t in target_ids]
+    return matrix
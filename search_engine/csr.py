@@ -0,0 +1,105 @@
+import numpy as np
+
+
+class CSRGraph:
+    """压缩稀疏行(CSR)格式的图
+
+    节点名在加载时一次性映射为 0..n-1 的整数 id，邻接关系保存在三个 NumPy 数组中：
+    offsets[u]:offsets[u+1] 是节点 u 的出边在 targets / weights 中的区间。
+    权重按 float64 保存，累加出的路径代价与用 Python 浮点数逐条相加一致。
+    """
+
+    def __init__(self, offsets, targets, weights, names=None, index=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.names = names  # id -> 节点名，为 None 时 id 本身就是节点名
+        if index is None and names is not None:
+            index = {name: i for i, name in enumerate(names)}
+        self.index = index
+        self._reverse = None
+
+    @classmethod
+    def from_edge_arrays(cls, src, dst, weight=None, num_nodes=None, names=None):
+        """由边数组(起点 id、终点 id、权重)构建，适合直接加载大规模路网"""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int32)
+        if weight is None:
+            weight = np.ones(len(src), dtype=np.float64)
+        else:
+            weight = np.asarray(weight, dtype=np.float64)
+        if num_nodes is None:
+            num_nodes = len(names) if names is not None else int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+
+        # 按起点稳定排序，保持每个节点邻居的原始顺序
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=offsets[1:])
+        return cls(offsets, dst[order], weight[order], names)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """由 {节点: [邻居, ...]} 或 {节点: {邻居: 权重}} 形式的邻接表构建"""
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        # 只作为邻居出现的节点也要分配 id
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(names)
+                    names.append(neighbor)
+
+        src, dst, weight = [], [], []
+        for node, neighbors in graph.items():
+            u = index[node]
+            weighted = isinstance(neighbors, dict)
+            for neighbor in neighbors:
+                src.append(u)
+                dst.append(index[neighbor])
+                weight.append(neighbors[neighbor] if weighted else 1)
+        return cls.from_edge_arrays(src, dst, weight, len(names), names)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def id_of(self, name):
+        """节点名 -> id"""
+        return name if self.index is None else self.index[name]
+
+    def name_of(self, node_id):
+        """id -> 节点名"""
+        return node_id if self.names is None else self.names[node_id]
+
+    def neighbors(self, u):
+        """节点 u 的邻居 id 列表"""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]].tolist()
+
+    def reverse(self):
+        """所有边反向后的图，首次调用时构建并缓存，供双向搜索的后向一侧使用"""
+        if self._reverse is None:
+            src = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.offsets))
+            order = np.argsort(self.targets, kind='stable')
+            offsets = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.targets, minlength=self.num_nodes), out=offsets[1:])
+            reverse = CSRGraph(offsets, src[order], self.weights[order], self.names, self.index)
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def edges(self, u):
+        """节点 u 的 (邻居 id, 权重) 列表"""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return list(zip(self.targets[lo:hi].tolist(), self.weights[lo:hi].tolist()))
+
+
+def as_csr(graph):
+    """已是 CSRGraph 则原样返回，否则由邻接表字典构建
+
+    重复查询时应先调用一次 CSRGraph.from_dict，再把结果传给各搜索函数。
+    """
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
@@ -0,0 +1,355 @@
+import heapq
+from collections import deque
+
+from .csr import as_csr
+from .result import SearchResult
+
+
+def _reconstruct(came_from, node):
+    """沿父指针(字典)回溯出路径"""
+    path = [node]
+    while node in came_from:
+        node = came_from[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def _trace_parents(parent, node):
+    """沿父指针数组回溯出路径，起点的父节点为 -1"""
+    path = []
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+class _NamedObserver:
+    """把搜索内部的整数 id 翻译回节点名后再转发给观察者"""
+
+    def __init__(self, observer, graph):
+        self.observer = observer
+        self.name_of = graph.name_of
+
+    def on_expand(self, node):
+        self.observer.on_expand(self.name_of(node))
+
+    def on_push(self, node, parent):
+        self.observer.on_push(self.name_of(node), self.name_of(parent))
+
+    def on_relax(self, node, parent):
+        self.observer.on_relax(self.name_of(node), self.name_of(parent))
+
+    def on_prune(self, node):
+        self.observer.on_prune(self.name_of(node))
+
+    def on_backtrack(self, node):
+        self.observer.on_backtrack(self.name_of(node))
+
+    def on_path(self, path):
+        self.observer.on_path([self.name_of(u) for u in path])
+
+
+def _run_named(search, graph, start, goal, observer):
+    """按节点名调用基于 id 的搜索，并把结果路径翻译回节点名"""
+    graph = as_csr(graph)
+    if getattr(observer, 'wants_ids', False):
+        # 轨迹记录器直接收整数 id，回放时再翻译
+        observer.set_decoder(names=graph.names)
+    elif observer is not None and graph.names is not None:
+        observer = _NamedObserver(observer, graph)
+    result = search(graph, graph.id_of(start), graph.id_of(goal), observer)
+    if result.path is not None:
+        result.path = [graph.name_of(u) for u in result.path]
+    if 'meeting' in result.stats:
+        result.stats['meeting'] = graph.name_of(result.stats['meeting'])
+    return result
+
+
+def _bfs(graph, start, goal, observer=None):
+    """基于 id 的 BFS，graph 为 CSRGraph"""
+    result = SearchResult()
+    if start == goal:
+        result.path, result.cost = [start], 0
+        if observer is not None:
+            observer.on_path(result.path)
+        return result
+
+    offsets, targets = graph.offsets, graph.targets
+    # 边缘中只存节点 id，路径通过父指针数组在成功时一次性回溯
+    parent = [-1] * graph.num_nodes
+    visited = bytearray(graph.num_nodes)
+    visited[start] = 1
+    queue = deque([start])
+    result.generated = 1
+
+    while queue:
+        node = queue.popleft()
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(node)
+
+        for neighbor in targets[offsets[node]:offsets[node + 1]].tolist():
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            parent[neighbor] = node
+            result.generated += 1
+            if neighbor == goal:
+                result.path = _trace_parents(parent, goal)
+                result.cost = len(result.path) - 1
+                if observer is not None:
+                    observer.on_path(result.path)
+                return result
+            queue.append(neighbor)
+            if observer is not None:
+                observer.on_push(neighbor, node)
+
+    return result
+
+
+def _dfs(graph, start, goal, observer=None):
+    """基于 id 的深度优先搜索，返回找到的第一条路径(不保证最短)"""
+    result = SearchResult()
+    offsets, targets = graph.offsets, graph.targets
+    parent = [-1] * graph.num_nodes
+    visited = bytearray(graph.num_nodes)
+    stack = [start]
+    result.generated = 1
+
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(node)
+
+        if node == goal:
+            result.path = _trace_parents(parent, goal)
+            result.cost = len(result.path) - 1
+            if observer is not None:
+                observer.on_path(result.path)
+            return result
+
+        # 逆序压栈，使邻居按邻接表顺序出栈；后压入者覆盖父指针，与出栈顺序一致
+        for neighbor in reversed(targets[offsets[node]:offsets[node + 1]].tolist()):
+            if not visited[neighbor]:
+                parent[neighbor] = node
+                stack.append(neighbor)
+                result.generated += 1
+                if observer is not None:
+                    observer.on_push(neighbor, node)
+
+    return result
+
+
+def _ucs(graph, start, goal, observer=None):
+    """基于 id 的一致代价搜索(Dijkstra)，边代价取自 graph.weights
+
+    使用无锁的 heapq；堆不支持 decrease-key，改进代价时直接压入新条目，
+    旧条目出队时发现代价已过期便丢弃(惰性删除)。要求边权非负。
+    """
+    result = SearchResult()
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    inf = float('inf')
+    parent = [-1] * graph.num_nodes
+    dist = [inf] * graph.num_nodes
+    dist[start] = 0.0
+    open_set = [(0.0, start)]
+    result.generated = 1
+    stale = 0         # 惰性删除丢弃的过期条目数
+    decrease_key = 0  # 已在堆中的节点代价被改进的次数
+    max_heap = 1
+
+    while open_set:
+        cost, node = heapq.heappop(open_set)
+        if cost > dist[node]:
+            stale += 1
+            if observer is not None:
+                observer.on_prune(node)
+            continue
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(node)
+
+        if node == goal:
+            result.path = _trace_parents(parent, goal)
+            result.cost = cost
+            if observer is not None:
+                observer.on_path(result.path)
+            break
+
+        lo, hi = offsets[node], offsets[node + 1]
+        for neighbor, weight in zip(targets[lo:hi].tolist(), weights[lo:hi].tolist()):
+            new_cost = cost + weight
+            old_cost = dist[neighbor]
+            if new_cost < old_cost:
+                if old_cost != inf:
+                    decrease_key += 1
+                dist[neighbor] = new_cost
+                parent[neighbor] = node
+                heapq.heappush(open_set, (new_cost, neighbor))
+                result.generated += 1
+                if observer is not None:
+                    if old_cost != inf:
+                        observer.on_relax(neighbor, node)
+                    else:
+                        observer.on_push(neighbor, node)
+        if len(open_set) > max_heap:
+            max_heap = len(open_set)
+
+    result.stats.update(stale=stale, decrease_key=decrease_key, max_heap=max_heap)
+    return result
+
+
+def _bidirectional_bfs(graph, start, goal, observer=None):
+    """基于 id 的双向 BFS：每轮扩展较小一侧的一整层，两侧相遇即得最短路径"""
+    result = SearchResult()
+    if start == goal:
+        result.path, result.cost = [start], 0
+        if observer is not None:
+            observer.on_path(result.path)
+        return result
+
+    n = graph.num_nodes
+    sides = (graph, graph.reverse())  # 后向一侧沿反向边搜索
+    parent = ([-1] * n, [-1] * n)
+    depth = ([-1] * n, [-1] * n)
+    depth[0][start] = 0
+    depth[1][goal] = 0
+    frontier = [[start], [goal]]
+    result.generated = 2
+
+    while frontier[0] and frontier[1]:
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        offsets, targets = sides[side].offsets, sides[side].targets
+        mine, other, par = depth[side], depth[1 - side], parent[side]
+        next_level = []
+        for node in frontier[side]:
+            result.expanded += 1
+            if observer is not None:
+                observer.on_expand(node)
+            for neighbor in targets[offsets[node]:offsets[node + 1]].tolist():
+                if mine[neighbor] != -1:
+                    continue
+                mine[neighbor] = mine[node] + 1
+                par[neighbor] = node
+                result.generated += 1
+                if other[neighbor] != -1:
+                    # 之前的层都未相遇，所以首次相遇点给出的长度就是最短的
+                    result.path = _join_paths(parent, neighbor)
+                    result.cost = len(result.path) - 1
+                    result.stats['meeting'] = neighbor
+                    if observer is not None:
+                        observer.on_path(result.path)
+                    return result
+                next_level.append(neighbor)
+                if observer is not None:
+                    observer.on_push(neighbor, node)
+        frontier[side] = next_level
+
+    return result
+
+
+def _join_paths(parent, meeting):
+    """拼接前向路径(起点 -> 相遇点)与后向路径(相遇点 -> 终点)"""
+    forward = _trace_parents(parent[0], meeting)
+    backward = _trace_parents(parent[1], meeting)
+    backward.reverse()
+    return forward + backward[1:]
+
+
+def _bidirectional_ucs(graph, start, goal, observer=None):
+    """基于 id 的双向 Dijkstra
+
+    两侧各维护一个惰性删除的堆，每次扩展堆顶代价较小的一侧；
+    mu 为目前经过某个相遇点的最短路径长度，当两侧堆顶之和不小于 mu 时终止，
+    此时不可能再有更短的路径。
+    """
+    result = SearchResult()
+    inf = float('inf')
+    n = graph.num_nodes
+    sides = (graph, graph.reverse())
+    parent = ([-1] * n, [-1] * n)
+    dist = ([inf] * n, [inf] * n)
+    dist[0][start] = 0.0
+    dist[1][goal] = 0.0
+    heaps = ([(0.0, start)], [(0.0, goal)])
+    mu, meeting = (0.0, start) if start == goal else (inf, -1)
+    result.generated = 2
+    stale = 0
+
+    while heaps[0] and heaps[1]:
+        top_f, top_b = heaps[0][0][0], heaps[1][0][0]
+        if top_f + top_b >= mu:
+            break
+        side = 0 if top_f <= top_b else 1
+        cost, node = heapq.heappop(heaps[side])
+        mine, other, par = dist[side], dist[1 - side], parent[side]
+        if cost > mine[node]:
+            stale += 1
+            if observer is not None:
+                observer.on_prune(node)
+            continue
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(node)
+
+        graph_side = sides[side]
+        lo, hi = graph_side.offsets[node], graph_side.offsets[node + 1]
+        for neighbor, weight in zip(graph_side.targets[lo:hi].tolist(), graph_side.weights[lo:hi].tolist()):
+            new_cost = cost + weight
+            old_cost = mine[neighbor]
+            if new_cost < old_cost:
+                mine[neighbor] = new_cost
+                par[neighbor] = node
+                heapq.heappush(heaps[side], (new_cost, neighbor))
+                result.generated += 1
+                if observer is not None:
+                    if old_cost != inf:
+                        observer.on_relax(neighbor, node)
+                    else:
+                        observer.on_push(neighbor, node)
+                if new_cost + other[neighbor] < mu:
+                    mu = new_cost + other[neighbor]
+                    meeting = neighbor
+
+    if meeting != -1:
+        result.path = _join_paths(parent, meeting)
+        result.cost = mu
+        result.stats['meeting'] = meeting
+        if observer is not None:
+            observer.on_path(result.path)
+    result.stats['stale'] = stale
+    return result
+
+
+def bfs(graph, start, goal, observer=None, bidirectional=False):
+    """广度优先搜索
+
+    graph 可以是 CSRGraph，也可以是 {节点: [邻居, ...]} 形式的邻接表；
+    在生成节点时做目标测试，返回边数最少的路径。
+    bidirectional=True 时从起点和终点同时搜索，在中间相遇。
+    """
+    search = _bidirectional_bfs if bidirectional else _bfs
+    return _run_named(search, graph, start, goal, observer)
+
+
+def dfs(graph, start, goal, observer=None):
+    """深度优先搜索，返回找到的第一条路径，不保证最短"""
+    return _run_named(_dfs, graph, start, goal, observer)
+
+
+def ucs(graph, start, goal, observer=None, bidirectional=False):
+    """一致代价搜索(Dijkstra)
+
+    graph 可以是 CSRGraph、带权邻接表 {节点: {邻居: 权重}}，
+    或不带权的 {节点: [邻居, ...]}(此时每条边代价为 1)。
+    result.stats 中给出惰性删除的统计：stale、decrease_key、max_heap。
+    bidirectional=True 时使用双向 Dijkstra。
+    """
+    search = _bidirectional_ucs if bidirectional else _ucs
+    return _run_named(search, graph, start, goal, observer)
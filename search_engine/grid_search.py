@@ -0,0 +1,261 @@
+import heapq
+from functools import partial
+
+import numpy as np
+
+from .graph_search import _trace_parents
+from .heuristics import SQRT2, get_heuristic
+from .jps import _jps
+from .result import SearchResult
+
+# 对角移动时对两侧正交格子的要求：需要几个可通行
+CORNER_CUTTING = {
+    'never': 2,   # 两侧都可通行才能斜走，不会擦过障碍的角
+    'one': 1,     # 至少一侧可通行即可
+    'always': 0,  # 不检查，允许从两个障碍之间斜穿
+}
+
+
+class GridMap:
+    """直接基于 NumPy 占据栅格的网格表示
+
+    栅格四周补一圈障碍后按行展平，格子用一维整数下标表示，
+    邻居就是下标加上固定的偏移量，不需要任何越界检查，也不需要构建图。
+    0 表示可通行，非 0 表示障碍。
+    """
+
+    def __init__(self, grid):
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.width = self.cols + 2  # 补边后的行宽
+        padded = np.pad(grid != 0, 1, constant_values=True)
+        # bytes 的逐元素访问比 ndarray 快得多，1 表示可通行
+        self.passable = (~padded).astype(np.uint8).tobytes()
+        self.size = len(self.passable)
+        self.offsets = (-self.width, self.width, -1, 1)  # 上、下、左、右
+
+    def moves(self, connectivity=4, corner_cutting='never'):
+        """移动方式列表 (下标偏移, 代价, 侧边偏移a, 侧边偏移b, 需要可通行的侧边数)"""
+        if connectivity not in (4, 8):
+            raise ValueError(f"连通性只能是 4 或 8: {connectivity}")
+        if corner_cutting not in CORNER_CUTTING:
+            raise ValueError(f"未知的拐角规则: {corner_cutting}")
+        moves = [(offset, 1, 0, 0, 0) for offset in self.offsets]
+        if connectivity == 8:
+            need = CORNER_CUTTING[corner_cutting]
+            for di in (-self.width, self.width):
+                for dj in (-1, 1):
+                    moves.append((di + dj, SQRT2, di, dj, need))
+        return moves
+
+    def index(self, cell):
+        """(行, 列) -> 一维下标"""
+        return (cell[0] + 1) * self.width + cell[1] + 1
+
+    def cell(self, idx):
+        """一维下标 -> (行, 列)"""
+        i, j = divmod(idx, self.width)
+        return (i - 1, j - 1)
+
+
+def as_grid_map(grid):
+    """已是 GridMap 则原样返回，否则由二维数组构建
+
+    同一张地图重复查询时应先构建一次 GridMap 再传给各搜索函数。
+    """
+    return grid if isinstance(grid, GridMap) else GridMap(grid)
+
+
+class _CellObserver:
+    """把一维下标翻译回 (行, 列) 后再转发给观察者"""
+
+    def __init__(self, observer, grid_map):
+        self.observer = observer
+        self.cell = grid_map.cell
+
+    def on_expand(self, node):
+        self.observer.on_expand(self.cell(node))
+
+    def on_push(self, node, parent):
+        self.observer.on_push(self.cell(node), self.cell(parent))
+
+    def on_relax(self, node, parent):
+        self.observer.on_relax(self.cell(node), self.cell(parent))
+
+    def on_prune(self, node):
+        self.observer.on_prune(self.cell(node))
+
+    def on_backtrack(self, node):
+        self.observer.on_backtrack(self.cell(node))
+
+    def on_path(self, path):
+        self.observer.on_path([self.cell(u) for u in path])
+
+
+def _run_on_grid(search, grid, start, goal, observer, **options):
+    """按 (行, 列) 调用基于一维下标的网格搜索"""
+    grid_map = as_grid_map(grid)
+    s, t = grid_map.index(start), grid_map.index(goal)
+    if not (grid_map.passable[s] and grid_map.passable[t]):
+        return SearchResult()
+    if getattr(observer, 'wants_ids', False):
+        observer.set_decoder(width=grid_map.width)
+    elif observer is not None:
+        observer = _CellObserver(observer, grid_map)
+    result = search(grid_map, s, t, observer, **options)
+    if result.path is not None:
+        result.path = [grid_map.cell(u) for u in result.path]
+    return result
+
+
+def _astar(grid_map, start, goal, observer=None, connectivity=4, heuristic=None, corner_cutting='never'):
+    """基于一维下标的 A*，g 值、父指针和关闭表都是按下标访问的数组"""
+    result = SearchResult()
+    width, passable = grid_map.width, grid_map.passable
+    moves = grid_map.moves(connectivity, corner_cutting)
+    heuristic = get_heuristic(heuristic, connectivity)
+    goal_i, goal_j = divmod(goal, width)
+
+    inf = float('inf')
+    g_score = [inf] * grid_map.size
+    parent = [-1] * grid_map.size
+    closed = bytearray(grid_map.size)
+
+    i, j = divmod(start, width)
+    h = heuristic(abs(i - goal_i), abs(j - goal_j))
+    g_score[start] = 0
+    # f 相同时优先 h 小(离终点近)的节点，可以少扩展很多对称路径
+    open_set = [(h, h, start)]
+    result.generated = 1
+
+    while open_set:
+        f, h, current = heapq.heappop(open_set)
+        if closed[current]:
+            if observer is not None:
+                observer.on_prune(current)
+            continue
+        closed[current] = 1
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(current)
+
+        if current == goal:
+            result.path = _trace_parents(parent, goal)
+            result.cost = g_score[goal]
+            if observer is not None:
+                observer.on_path(result.path)
+            return result
+
+        g = g_score[current]
+        for offset, step, side_a, side_b, need in moves:
+            neighbor = current + offset
+            if not passable[neighbor] or closed[neighbor]:
+                continue
+            if need and passable[current + side_a] + passable[current + side_b] < need:
+                continue
+            tentative_g = g + step
+            old_g = g_score[neighbor]
+            if tentative_g >= old_g:
+                continue
+            g_score[neighbor] = tentative_g
+            parent[neighbor] = current
+            i, j = divmod(neighbor, width)
+            h = heuristic(abs(i - goal_i), abs(j - goal_j))
+            heapq.heappush(open_set, (tentative_g + h, h, neighbor))
+            result.generated += 1
+            if observer is not None:
+                if old_g != inf:
+                    observer.on_relax(neighbor, current)
+                else:
+                    observer.on_push(neighbor, current)
+
+    return result
+
+
+def _greedy(grid_map, start, goal, observer=None, connectivity=4, heuristic=None, corner_cutting='never'):
+    """基于一维下标的贪婪最佳优先搜索"""
+    result = SearchResult()
+    width, passable = grid_map.width, grid_map.passable
+    moves = grid_map.moves(connectivity, corner_cutting)
+    heuristic = get_heuristic(heuristic, connectivity)
+    goal_i, goal_j = divmod(goal, width)
+
+    parent = [-1] * grid_map.size
+    cost = [0] * grid_map.size  # 沿父指针的实际路径代价，只用于报告结果
+    closed = bytearray(grid_map.size)
+    i, j = divmod(start, width)
+    open_set = [(heuristic(abs(i - goal_i), abs(j - goal_j)), start)]
+    result.generated = 1
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if closed[current]:
+            if observer is not None:
+                observer.on_prune(current)
+            continue
+        closed[current] = 1
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(current)
+
+        if current == goal:
+            result.path = _trace_parents(parent, goal)
+            result.cost = cost[goal]
+            if observer is not None:
+                observer.on_path(result.path)
+            return result
+
+        for offset, step, side_a, side_b, need in moves:
+            neighbor = current + offset
+            if not passable[neighbor] or closed[neighbor]:
+                continue
+            if need and passable[current + side_a] + passable[current + side_b] < need:
+                continue
+            parent[neighbor] = current
+            cost[neighbor] = cost[current] + step
+            i, j = divmod(neighbor, width)
+            heapq.heappush(open_set, (heuristic(abs(i - goal_i), abs(j - goal_j)), neighbor))
+            result.generated += 1
+            if observer is not None:
+                observer.on_push(neighbor, current)
+
+    return result
+
+
+_ASTAR_MODES = {
+    'plain': _astar,
+    'jps': _jps,
+    'jps+': partial(_jps, plus=True),
+}
+
+
+def astar(grid, start, goal, observer=None, mode='plain', connectivity=4, heuristic=None,
+          corner_cutting='never'):
+    """网格上的 A* 搜索
+
+    grid 可以是 0/1 二维数组，也可以是预先构建好的 GridMap；
+    start、goal 为 (行, 列)，返回的路径同样是 (行, 列) 列表。
+    connectivity 为 4 或 8，八连通时直走代价 1、斜走代价 √2，
+    corner_cutting 决定斜走能否擦过障碍的角('never'、'one'、'always')。
+    heuristic 可以是 heuristics.HEURISTICS 中的名字或函数 h(di, dj)，
+    默认四连通用 manhattan，八连通用 octile。
+    mode 为 'jps' 时使用跳点搜索，'jps+' 时使用预计算跳跃表(缓存在 GridMap 上)，
+    两者只支持四连通，返回的路径长度与普通 A* 相同，但扩展的节点少得多。
+    """
+    if mode not in _ASTAR_MODES:
+        raise ValueError(f"未知的 A* 模式: {mode}")
+    if mode != 'plain':
+        if connectivity != 4:
+            raise ValueError("跳点搜索只支持四连通网格")
+        return _run_on_grid(_ASTAR_MODES[mode], grid, start, goal, observer, heuristic=heuristic)
+    return _run_on_grid(_astar, grid, start, goal, observer, connectivity=connectivity,
+                        heuristic=heuristic, corner_cutting=corner_cutting)
+
+
+def greedy(grid, start, goal, observer=None, connectivity=4, heuristic=None, corner_cutting='never'):
+    """网格上的贪婪最佳优先搜索，只按启发式值排序，不保证最优
+
+    connectivity、heuristic、corner_cutting 的含义同 astar。
+    """
+    return _run_on_grid(_greedy, grid, start, goal, observer, connectivity=connectivity,
+                        heuristic=heuristic, corner_cutting=corner_cutting)
@@ -0,0 +1,54 @@
+"""网格搜索的启发式函数
+
+每个函数接收行、列方向上的距离差的绝对值 (di, dj)。
+四连通下 manhattan 最紧；八连通(对角代价 √2)下 octile 最紧，
+euclidean、chebyshev、zero 也可采纳但更松，manhattan 在八连通下不可采纳。
+"""
+import math
+
+SQRT2 = math.sqrt(2)
+
+
+def manhattan(di, dj):
+    """曼哈顿距离，四连通网格的精确下界"""
+    return di + dj
+
+
+def octile(di, dj):
+    """八方向距离：先走对角线再走直线"""
+    return (SQRT2 - 1) * min(di, dj) + max(di, dj)
+
+
+def euclidean(di, dj):
+    """欧几里得距离"""
+    return math.sqrt(di * di + dj * dj)
+
+
+def chebyshev(di, dj):
+    """切比雪夫距离(对角代价按 1 计)"""
+    return max(di, dj)
+
+
+def zero(di, dj):
+    """恒为 0，此时 A* 退化为 Dijkstra"""
+    return 0
+
+
+HEURISTICS = {
+    'manhattan': manhattan,
+    'octile': octile,
+    'euclidean': euclidean,
+    'chebyshev': chebyshev,
+    'zero': zero,
+}
+
+
+def get_heuristic(heuristic, connectivity):
+    """按名字或函数取启发式；未指定时四连通用 manhattan，八连通用 octile"""
+    if heuristic is None:
+        return manhattan if connectivity == 4 else octile
+    if callable(heuristic):
+        return heuristic
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"未知的启发式函数: {heuristic}")
+    return HEURISTICS[heuristic]
@@ -0,0 +1,221 @@
+"""四连通均匀代价网格上的跳点搜索(JPS)与 JPS+
+
+网格中存在大量代价相同的对称路径，普通 A* 会把它们全部放进开放列表。
+JPS 沿直线"跳跃"，只在出现强制邻居(forced neighbor)的格子停下，
+开放列表里只剩这些跳点，路径长度与 A* 相同。
+
+四连通规则：水平移动遇到强制邻居即停；竖直移动除强制邻居外，
+若从当前格向左或向右能跳到跳点(或终点)也要停下，这样转弯只发生在跳点上。
+JPS+ 把与终点无关的跳跃距离预先算成表，查询时只需查表并检查终点是否在跳跃线段上。
+"""
+import heapq
+
+import numpy as np
+
+from .graph_search import _trace_parents
+from .heuristics import get_heuristic
+from .result import SearchResult
+
+
+def _jump_horizontal(passable, node, d, width, goal):
+    """从 node 沿水平方向 d(±1)跳跃，返回跳点下标，撞墙返回 -1"""
+    while True:
+        node += d
+        if not passable[node]:
+            return -1
+        if node == goal:
+            return node
+        if (passable[node - width] and not passable[node - width - d]) or \
+                (passable[node + width] and not passable[node + width - d]):
+            return node
+
+
+def _jump_vertical(passable, node, d, width, goal):
+    """从 node 沿竖直方向 d(±width)跳跃，返回跳点下标，撞墙返回 -1"""
+    while True:
+        node += d
+        if not passable[node]:
+            return -1
+        if node == goal:
+            return node
+        if (passable[node - 1] and not passable[node - 1 - d]) or \
+                (passable[node + 1] and not passable[node + 1 - d]):
+            return node
+        if _jump_horizontal(passable, node, 1, width, goal) != -1 or \
+                _jump_horizontal(passable, node, -1, width, goal) != -1:
+            return node
+
+
+def _next_marked(marked, forward):
+    """对每个下标 x，求严格位于 x 之后(forward)或之前的第一个被标记下标，没有时为 -1"""
+    size = len(marked)
+    idx = np.arange(size)
+    if forward:
+        nearest = np.minimum.accumulate(np.where(marked, idx, size)[::-1])[::-1]
+        result = np.full(size, size)
+        result[:-1] = nearest[1:]
+        result[result == size] = -1
+    else:
+        nearest = np.maximum.accumulate(np.where(marked, idx, -1))
+        result = np.full(size, -1)
+        result[1:] = nearest[:-1]
+    return result
+
+
+class JumpTable:
+    """JPS+ 预计算表：每个格子在四个方向上的下一个跳点(与终点无关的部分)"""
+
+    def __init__(self, grid_map):
+        width = grid_map.width
+        height = grid_map.size // width
+        walk = np.frombuffer(grid_map.passable, dtype=np.uint8).astype(bool)
+        wall = ~walk
+
+        def shifted(k):
+            """shifted(k)[c] == walk[c + k]，越界处视为障碍"""
+            out = np.zeros_like(walk)
+            if k >= 0:
+                out[:len(walk) - k] = walk[k:]
+            else:
+                out[-k:] = walk[:k]
+            return out
+
+        # 水平跳跃：下一个"强制邻居或墙"，落在墙上则没有跳点
+        horizontal = {}
+        for d in (1, -1):
+            forced = (shifted(-width) & ~shifted(-width - d)) | (shifted(width) & ~shifted(width - d))
+            target = _next_marked(forced | wall, forward=d > 0)
+            target[(target >= 0) & wall[np.maximum(target, 0)]] = -1
+            horizontal[d] = target
+        has_horizontal = (horizontal[1] != -1) | (horizontal[-1] != -1)
+
+        # 竖直跳跃在转置后的布局上做同样的扫描，再映射回原下标
+        transpose = np.arange(grid_map.size).reshape(height, width).T.ravel()
+        vertical = {}
+        for d in (width, -width):
+            forced = (shifted(-1) & ~shifted(-1 - d)) | (shifted(1) & ~shifted(1 - d))
+            stop = (forced | has_horizontal | wall)[transpose]
+            target_t = _next_marked(stop, forward=d > 0)
+            target = np.full(grid_map.size, -1)
+            found = target_t >= 0
+            target[transpose[found]] = transpose[target_t[found]]
+            target[(target >= 0) & wall[np.maximum(target, 0)]] = -1
+            vertical[d] = target
+
+        self.jump = {d: t.tolist() for d, t in {**horizontal, **vertical}.items()}
+        # 行/列上连续可通行线段的编号，用于判断终点是否在跳跃线段上
+        self.row_run = np.cumsum(wall).tolist()
+        col_run = np.empty(grid_map.size, dtype=np.int64)
+        col_run[transpose] = np.cumsum(wall[transpose])
+        self.col_run = col_run.tolist()
+
+
+def jump_table(grid_map):
+    """GridMap 对应的 JPS+ 表，首次使用时构建并缓存在 grid_map 上"""
+    table = getattr(grid_map, '_jump_table', None)
+    if table is None:
+        table = grid_map._jump_table = JumpTable(grid_map)
+    return table
+
+
+def _jump_plus(table, passable, node, d, width, goal):
+    """查表完成一次跳跃，额外处理终点落在跳跃线段上的情况"""
+    target = table.jump[d][node]
+    row_run, col_run = table.row_run, table.col_run
+    if d == 1 or d == -1:
+        if row_run[node] == row_run[goal] and (goal - node) * d > 0 and \
+                (target == -1 or (target - goal) * d >= 0):
+            return goal
+        return target
+    # 竖直跳跃：经过终点所在行、且能水平看到终点的格子也是跳点
+    meet = (goal // width) * width + node % width
+    if (meet - node) * d > 0 and passable[meet] and col_run[meet] == col_run[node] and \
+            row_run[meet] == row_run[goal] and (target == -1 or (target - meet) * d >= 0):
+        return meet
+    return target
+
+
+def _expand_segments(jump_path, width):
+    """把跳点序列展开为逐格路径，相邻跳点总在同一行或同一列"""
+    path = [jump_path[0]]
+    for a, b in zip(jump_path, jump_path[1:]):
+        step = (1 if b > a else -1) if a // width == b // width else (width if b > a else -width)
+        path.extend(range(a + step, b + step, step))
+    return path
+
+
+def _jps(grid_map, start, goal, observer=None, plus=False, heuristic=None):
+    """基于一维下标的跳点搜索；plus=True 时使用 JPS+ 预计算表"""
+    result = SearchResult()
+    width, passable = grid_map.width, grid_map.passable
+    table = jump_table(grid_map) if plus else None
+    heuristic = get_heuristic(heuristic, 4)
+    goal_i, goal_j = divmod(goal, width)
+
+    inf = float('inf')
+    g_score = {start: 0}
+    parent = {start: -1}
+    closed = set()
+    i, j = divmod(start, width)
+    h = heuristic(abs(i - goal_i), abs(j - goal_j))
+    open_set = [(h, h, start)]
+    result.generated = 1
+
+    while open_set:
+        f, h, current = heapq.heappop(open_set)
+        if current in closed:
+            if observer is not None:
+                observer.on_prune(current)
+            continue
+        closed.add(current)
+        result.expanded += 1
+        if observer is not None:
+            observer.on_expand(current)
+
+        if current == goal:
+            jump_path = _trace_parents(parent, goal)
+            result.path = _expand_segments(jump_path, width)
+            result.cost = g_score[goal]
+            result.stats['jump_points'] = len(jump_path)
+            if observer is not None:
+                observer.on_path(result.path)
+            return result
+
+        # 邻居剪枝：沿来时方向继续，另外只需尝试与之垂直的两个方向
+        p = parent[current]
+        if p == -1:
+            directions = (-width, width, -1, 1)
+        elif abs(current - p) < width:
+            d = 1 if current > p else -1
+            directions = (d, -width, width)
+        else:
+            d = width if current > p else -width
+            directions = (d, -1, 1)
+
+        g = g_score[current]
+        for d in directions:
+            if plus:
+                jump = _jump_plus(table, passable, current, d, width, goal)
+            elif d == 1 or d == -1:
+                jump = _jump_horizontal(passable, current, d, width, goal)
+            else:
+                jump = _jump_vertical(passable, current, d, width, goal)
+            if jump == -1 or jump in closed:
+                continue
+            tentative_g = g + abs(jump - current) // (1 if d == 1 or d == -1 else width)
+            old_g = g_score.get(jump, inf)
+            if tentative_g >= old_g:
+                continue
+            g_score[jump] = tentative_g
+            parent[jump] = current
+            i, j = divmod(jump, width)
+            h = heuristic(abs(i - goal_i), abs(j - goal_j))
+            heapq.heappush(open_set, (tentative_g + h, h, jump))
+            result.generated += 1
+            if observer is not None:
+                if old_g != inf:
+                    observer.on_relax(jump, current)
+                else:
+                    observer.on_push(jump, current)
+
+    return result
@@ -0,0 +1,115 @@
+"""多进程批量查询
+
+图的 CSR 数组只拷贝一次到共享内存，工作进程在启动时直接映射这些内存，
+之后每个任务只传查询的整数 id，不再为每个任务 pickle 整张图。
+查询按起点分组后切块分发，结果按输入顺序收集。
+"""
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from .batch import _TREES, _group_by_source
+from .csr import CSRGraph, as_csr
+from .graph_search import _trace_parents
+from .result import SearchResult
+
+_ARRAYS = ('offsets', 'targets', 'weights')
+
+# 工作进程内的全局状态：共享内存块要一直持有，否则映射会失效
+_worker_graph = None
+_worker_blocks = None
+
+
+def _share_arrays(graph):
+    """把 CSR 数组拷贝进共享内存，返回 (内存块列表, 可 pickle 的描述)"""
+    blocks, spec = [], []
+    for name in _ARRAYS:
+        array = getattr(graph, name)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+        blocks.append(block)
+        spec.append((block.name, array.shape, array.dtype.str))
+    return blocks, spec
+
+
+def _attach(spec):
+    """工作进程初始化：按描述映射共享内存，构建不带节点名的 CSRGraph"""
+    global _worker_graph, _worker_blocks
+    _worker_blocks, arrays = [], []
+    for name, shape, dtype in spec:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    _worker_graph = CSRGraph(*arrays)
+
+
+def _solve_chunk(task):
+    """在工作进程中回答一块查询：[(起点 id, [(序号, 终点 id), ...]), ...]"""
+    method, return_paths, groups = task
+    build_tree = _TREES[method]
+    answers = []
+    for source, queries in groups:
+        dist, parent, expanded = build_tree(_worker_graph, source, [t for _, t in queries])
+        for k, target in queries:
+            cost = dist[target]
+            path = _trace_parents(parent, target) if return_paths and cost != float('inf') else None
+            answers.append((k, cost, path, expanded, len(queries)))
+    return answers
+
+
+class ParallelRunner:
+    """持有共享内存中的图和一个进程池，可反复提交批量查询
+
+    用法：
+        with ParallelRunner(graph, processes=32) as runner:
+            results = runner.batch_search(pairs)
+    """
+
+    def __init__(self, graph, processes=None):
+        self.graph = as_csr(graph)
+        self.processes = processes or os.cpu_count()
+        self._blocks, spec = _share_arrays(self.graph)
+        self._pool = Pool(self.processes, initializer=_attach, initargs=(spec,))
+
+    def batch_search(self, pairs, method='ucs', return_paths=True, chunk_size=None):
+        """与 batch.batch_search 相同的接口和返回值，查询分块后并行计算"""
+        if method not in _TREES:
+            raise ValueError(f"未知的批量搜索方法: {method}")
+        graph = self.graph
+        groups = list(_group_by_source(graph, pairs).items())
+        if chunk_size is None:
+            # 每个进程大约分到 4 块，兼顾负载均衡和通信开销
+            chunk_size = max(1, len(groups) // (self.processes * 4))
+        tasks = [(method, return_paths, groups[i:i + chunk_size]) for i in range(0, len(groups), chunk_size)]
+
+        results = [None] * len(pairs)
+        for answers in self._pool.imap(_solve_chunk, tasks):
+            for k, cost, path, expanded, tree_size in answers:
+                result = SearchResult(expanded=expanded, stats={'tree_size': tree_size})
+                if cost != float('inf'):
+                    result.cost = cost
+                    result.path = [graph.name_of(u) for u in path] if return_paths else []
+                results[k] = result
+        return results
+
+    def close(self):
+        """关闭进程池并释放共享内存"""
+        self._pool.close()
+        self._pool.join()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parallel_batch_search(graph, pairs, method='ucs', processes=None, return_paths=True, chunk_size=None):
+    """一次性的并行批量查询；需要反复查询同一张图时请直接使用 ParallelRunner"""
+    with ParallelRunner(graph, processes) as runner:
+        return runner.batch_search(pairs, method, return_paths, chunk_size)
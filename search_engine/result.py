@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SearchResult:
+    """一次搜索的结果：路径、代价与扩展统计"""
+    path: list = None        # 起点到终点的路径，未找到时为 None
+    cost: float = float('inf')  # 路径代价
+    expanded: int = 0        # 出队并扩展的节点数
+    generated: int = 0       # 入队(生成)的节点数
+    stats: dict = field(default_factory=dict)  # 各算法额外的统计信息
+
+    @property
+    def found(self):
+        return self.path is not None
+
+
+class SearchObserver:
+    """搜索过程的观察者，默认什么也不做
+
+    可视化模块继承本类并重写需要的回调；
+    搜索函数在 observer 为 None 时完全跳过回调，不产生额外开销。
+    """
+
+    def on_expand(self, node):
+        """节点出队并被扩展"""
+
+    def on_push(self, node, parent):
+        """节点由 parent 生成并加入边缘(frontier)"""
+
+    def on_relax(self, node, parent):
+        """已在边缘中的节点经由 parent 得到更小的代价，默认按 on_push 处理"""
+        self.on_push(node, parent)
+
+    def on_prune(self, node):
+        """出队的条目已过期或节点已关闭，被直接丢弃"""
+
+    def on_backtrack(self, node):
+        """深度优先搜索退出节点，把它从当前路径上移除"""
+
+    def on_path(self, path):
+        """找到最终路径"""
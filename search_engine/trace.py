@@ -0,0 +1,141 @@
+import time
+from array import array
+
+import numpy as np
+
+from .result import SearchObserver
+
+# 事件类型，每个事件占一个字节
+EXPAND, PUSH, RELAX, PRUNE, PATH, BACKTRACK = range(6)
+
+
+class SearchTrace(SearchObserver):
+    """把搜索事件记录成紧凑的二进制日志，事后再回放给任意观察者
+
+    事件类型、节点、父节点分别存进三个 array，每个事件只占 9 个字节，
+    记录时不做任何翻译和绘图，因此几乎不拖慢搜索本身。
+    节点以引擎内部的整数 id(图)或一维下标(网格)记录，
+    回放时才翻译回节点名或 (行, 列)。
+    """
+
+    # 告诉引擎直接传入整数 id，不要套一层名字翻译
+    wants_ids = True
+
+    def __init__(self):
+        self.kinds = array('b')
+        self.nodes = array('i')
+        self.parents = array('i')
+        self.names = None
+        self.width = None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def set_decoder(self, names=None, width=None):
+        """由引擎调用：记录 id -> 节点名 的表，或网格补边后的行宽"""
+        self.names = names
+        self.width = width
+
+    def _record(self, kind, node, parent=-1):
+        self.kinds.append(kind)
+        self.nodes.append(node)
+        self.parents.append(parent)
+
+    def on_expand(self, node):
+        self._record(EXPAND, node)
+
+    def on_push(self, node, parent):
+        self._record(PUSH, node, parent)
+
+    def on_relax(self, node, parent):
+        self._record(RELAX, node, parent)
+
+    def on_prune(self, node):
+        self._record(PRUNE, node)
+
+    def on_backtrack(self, node):
+        self._record(BACKTRACK, node)
+
+    def on_path(self, path):
+        # 路径拆成一串连续的 PATH 事件，回放时再合并
+        for node in path:
+            self._record(PATH, node)
+
+    def decode(self, node):
+        """内部 id -> 节点名或 (行, 列)"""
+        if self.width is not None:
+            i, j = divmod(node, self.width)
+            return (i - 1, j - 1)
+        if self.names is not None:
+            return self.names[node]
+        return node
+
+    def counts(self):
+        """各类事件的数量"""
+        counts = np.bincount(np.frombuffer(self.kinds, dtype=np.int8), minlength=6)
+        return dict(zip(('expand', 'push', 'relax', 'prune', 'path', 'backtrack'), counts.tolist()))
+
+    def replay(self, observer, interval=0.0, start=0, stop=None):
+        """按记录顺序把事件回放给 observer
+
+        interval 为相邻事件之间的停顿秒数，start/stop 可以只回放一段；
+        连续的 PATH 事件合并成一次 on_path 调用。
+        """
+        kinds, nodes, parents = self.kinds, self.nodes, self.parents
+        decode = self.decode
+        stop = len(kinds) if stop is None else min(stop, len(kinds))
+        k = start
+        while k < stop:
+            kind = kinds[k]
+            if kind == PATH:
+                end = k
+                while end < stop and kinds[end] == PATH:
+                    end += 1
+                observer.on_path([decode(u) for u in nodes[k:end]])
+                k = end
+            else:
+                node = decode(nodes[k])
+                if kind == EXPAND:
+                    observer.on_expand(node)
+                elif kind == PUSH:
+                    observer.on_push(node, decode(parents[k]))
+                elif kind == RELAX:
+                    observer.on_relax(node, decode(parents[k]))
+                elif kind == PRUNE:
+                    observer.on_prune(node)
+                else:
+                    observer.on_backtrack(node)
+                k += 1
+            if interval:
+                time.sleep(interval)
+
+    def save(self, path):
+        """保存为压缩的 .npz 文件"""
+        arrays = {
+            'kinds': np.frombuffer(self.kinds, dtype=np.int8),
+            'nodes': np.frombuffer(self.nodes, dtype=np.int32),
+            'parents': np.frombuffer(self.parents, dtype=np.int32),
+        }
+        if self.width is not None:
+            arrays['width'] = np.int64(self.width)
+        if self.names is not None:
+            # 节点名可能是元组，逐个填入一维对象数组，避免被展开成二维
+            names = np.empty(len(self.names), dtype=object)
+            for k, name in enumerate(self.names):
+                names[k] = name
+            arrays['names'] = names
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """读取 save 保存的轨迹(节点名以 pickle 保存，只应读取可信的文件)"""
+        trace = cls()
+        with np.load(path, allow_pickle=True) as data:
+            trace.kinds.frombytes(data['kinds'].astype(np.int8).tobytes())
+            trace.nodes.frombytes(data['nodes'].astype(np.int32).tobytes())
+            trace.parents.frombytes(data['parents'].astype(np.int32).tobytes())
+            if 'width' in data:
+                trace.width = int(data['width'])
+            if 'names' in data:
+                trace.names = data['names'].tolist()
+        return trace